@@ -11,12 +11,17 @@ Usage:
 
 import argparse
 import csv
+import functools
+import re
 import subprocess
 import sys
 import webbrowser
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+from src.storage.status_journal import STATUS_FILE_NAME, append_sent, load_statuses
+
 # Try to import pyperclip for clipboard, but make it optional
 try:
     import pyperclip
@@ -28,63 +33,155 @@ except ImportError:
 DATA_DIR = Path("data")
 LEADS_FILE = DATA_DIR / "leads.csv"
 
+# Status journal shared with CSVStorage, overlaid on leads.csv when reading
+# so marking a lead as sent doesn't rewrite the whole leads file
+STATUS_FILE = DATA_DIR / STATUS_FILE_NAME
 
-def load_leads():
-    """Load leads from CSV."""
-    if not LEADS_FILE.exists():
-        return []
+# Post ID segment of a Reddit post URL
+_COMMENTS_RE = re.compile(r"/comments/([^/?#\s]+)")
 
-    with open(LEADS_FILE, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+# Values of the "sent" / "comment_worthy" columns that count as true
+# (compared after .strip().lower())
+_TRUTHY = frozenset(("yes", "true", "1"))
+_YES = frozenset(("yes",))
+
+# Files at least this large are parsed with pandas' C reader when available
+PANDAS_MIN_BYTES = 256 * 1024
+
+
+def apply_status(lead, status_row):
+    """Overlay a journal entry onto a lead row."""
+    if status_row["status"]:
+        lead["status"] = status_row["status"]
+    if status_row["sent_date"]:
+        lead["sent"] = "yes"
+        lead["sent_date"] = status_row.get("sent_date", "")
+        if "action_status" in lead:
+            lead["action_status"] = "sent"
 
 
-def save_leads(leads):
-    """Save leads back to CSV."""
-    if not leads:
+def iter_leads():
+    """Stream leads from CSV one row at a time, with journaled statuses applied."""
+    if not LEADS_FILE.exists():
         return
 
-    fieldnames = leads[0].keys()
-    with open(LEADS_FILE, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(leads)
+    statuses = load_statuses(STATUS_FILE)
+
+    with open(LEADS_FILE, "r", encoding="utf-8") as f:
+        for lead in csv.DictReader(f):
+            if statuses:
+                status_row = statuses.get(extract_post_id(lead.get("post_url", "")))
+                if status_row:
+                    apply_status(lead, status_row)
+            yield lead
+
+
+def is_pending(lead):
+    """Check if a lead is comment-worthy, has a draft, and is not yet sent."""
+    # Fast path: status precomputed when the lead was saved
+    action_status = lead.get("action_status")
+    if action_status:
+        return action_status == "pending"
+
+    # Fallback for files written before the action_status column existed
+    cw = lead.get("comment_worthy", "")
+    draft = lead.get("public_draft", "")
+    sent = lead.get("sent", "")
+    return cw.strip().lower() in _YES and bool(draft.strip()) and sent.strip().lower() not in _TRUTHY
+
+
+def iter_pending_leads(leads):
+    """Yield leads that are comment-worthy but not yet sent."""
+    for lead in leads:
+        if is_pending(lead):
+            yield lead
 
 
 def get_pending_leads(leads):
     """Get leads that are comment-worthy but not yet sent."""
-    pending = []
-    for lead in leads:
-        # Check if comment-worthy and has a draft
-        comment_worthy = lead.get("comment_worthy", "").lower() == "yes"
-        has_draft = bool(lead.get("public_draft", "").strip())
-        sent = lead.get("sent", "").lower() in ("yes", "true", "1")
+    return list(iter_pending_leads(leads))
+
+
+def load_leads_fast():
+    """
+    Load leads.csv into a DataFrame of strings with journaled statuses applied.
+
+    Raises ImportError if pandas is not installed.
+    """
+    import pandas as pd
+
+    df = pd.read_csv(LEADS_FILE, dtype=str, keep_default_na=False, engine="c")
+    for column in ("comment_worthy", "public_draft", "sent"):
+        if column not in df:
+            df[column] = ""
+
+    statuses = load_statuses(STATUS_FILE)
+    if statuses and "post_url" in df:
+        sent_dates = {
+            post_id: row["sent_date"]
+            for post_id, row in statuses.items()
+            if row["sent_date"]
+        }
+        post_ids = df["post_url"].str.extract(_COMMENTS_RE.pattern, expand=False)
+        if "status" in df:
+            logged = post_ids.map({post_id: row["status"] for post_id, row in statuses.items() if row["status"]})
+            df["status"] = logged.fillna(df["status"])
+        journaled_dates = post_ids.map(sent_dates)
+        journaled = journaled_dates.notna()
+        if journaled.any():
+            df.loc[journaled, "sent"] = "yes"
+            df.loc[journaled, "sent_date"] = journaled_dates[journaled]
+            if "action_status" in df:
+                df.loc[journaled, "action_status"] = "sent"
+
+    return df
+
+
+def pending_mask(df):
+    """Vectorized is_pending over a DataFrame from load_leads_fast."""
+    legacy = (
+        df["comment_worthy"].str.strip().str.lower().isin(_YES)
+        & df["public_draft"].str.strip().str.len().gt(0)
+        & ~df["sent"].str.strip().str.lower().isin(_TRUTHY)
+    )
+    if "action_status" in df:
+        status = df["action_status"]
+        return status.eq("pending") | (status.eq("") & legacy)
+    return legacy
 
-        if comment_worthy and has_draft and not sent:
-            pending.append(lead)
 
-    return pending
+def load_pending_leads():
+    """Load all pending leads, using pandas for large files when available."""
+    if LEADS_FILE.exists() and LEADS_FILE.stat().st_size >= PANDAS_MIN_BYTES:
+        try:
+            df = load_leads_fast()
+            return df.loc[pending_mask(df)].to_dict("records")
+        except ImportError:
+            pass
 
+    return get_pending_leads(iter_leads())
 
+
+@functools.lru_cache(maxsize=4096)
 def extract_post_id(post_url):
     """Extract Reddit post ID from URL."""
     # URL format: https://reddit.com/r/sub/comments/POST_ID/...
-    parts = post_url.split("/comments/")
-    if len(parts) > 1:
-        return parts[1].split("/")[0]
-    return None
+    match = _COMMENTS_RE.search(post_url)
+    return match.group(1) if match else None
 
 
 def print_lead(lead, index=None):
     """Print a lead in a readable format."""
     prefix = f"[{index}] " if index is not None else ""
+    title = lead.get("title", "")
+    url = lead.get("post_url", "")
+    draft = lead.get("public_draft", "")
 
     print(f"\n{prefix}r/{lead.get('subreddit', 'unknown')}")
-    print(f"    Title: {lead.get('title', '')[:60]}...")
+    print(f"    Title: {title[:60]}...")
     print(f"    Score: {lead.get('signal_score', '?')}/10 ({lead.get('category', 'unknown')})")
-    print(f"    URL:   {lead.get('post_url', '')}")
+    print(f"    URL:   {url}")
 
-    draft = lead.get("public_draft", "")
     if draft:
         # Show first 100 chars of draft
         preview = draft[:100].replace("\n", " ")
@@ -93,8 +190,7 @@ def print_lead(lead, index=None):
 
 def cmd_list(args):
     """List all pending leads."""
-    leads = load_leads()
-    pending = get_pending_leads(leads)
+    pending = load_pending_leads()
 
     if not pending:
         print("No pending leads to action.")
@@ -118,14 +214,13 @@ def cmd_list(args):
 
 def cmd_next(args):
     """Show the next lead to action with full details."""
-    leads = load_leads()
-    pending = get_pending_leads(leads)
+    # Stop reading at the first pending lead
+    lead = next(iter_pending_leads(iter_leads()), None)
 
-    if not pending:
+    if lead is None:
         print("No pending leads to action.")
         return
 
-    lead = pending[0]
     post_id = extract_post_id(lead.get("post_url", ""))
 
     print(f"\n{'='*60}")
@@ -151,14 +246,12 @@ def cmd_next(args):
 
 def cmd_open(args):
     """Open the next lead in browser and copy comment to clipboard."""
-    leads = load_leads()
-    pending = get_pending_leads(leads)
+    lead = next(iter_pending_leads(iter_leads()), None)
 
-    if not pending:
+    if lead is None:
         print("No pending leads to action.")
         return
 
-    lead = pending[0]
     post_url = lead.get("post_url", "")
     draft = lead.get("public_draft", "")
     post_id = extract_post_id(post_url)
@@ -189,24 +282,22 @@ def cmd_sent(args):
         print("Usage: python action.py --sent POST_ID")
         return
 
-    leads = load_leads()
     found = False
 
-    for lead in leads:
+    for lead in iter_leads():
         post_url = lead.get("post_url", "")
         if args.post_id in post_url:
-            lead["sent"] = "yes"
-            lead["sent_date"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+            # Journal the change instead of rewriting leads.csv
+            sent_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+            append_sent(STATUS_FILE, extract_post_id(post_url) or args.post_id, sent_date)
             found = True
             print(f"Marked as sent: {lead.get('title', '')[:50]}...")
             break
 
     if found:
-        save_leads(leads)
-
         # Show remaining count
-        pending = get_pending_leads(leads)
-        print(f"\n{len(pending)} leads remaining")
+        remaining = sum(1 for _ in iter_pending_leads(iter_leads()))
+        print(f"\n{remaining} leads remaining")
     else:
         print(f"Lead not found: {args.post_id}")
         print("Use the post ID from the URL, e.g.: 1prpfyi")
@@ -214,20 +305,25 @@ def cmd_sent(args):
 
 def cmd_stats(args):
     """Show action statistics."""
-    leads = load_leads()
-
-    total = len(leads)
-    comment_worthy = sum(1 for l in leads if l.get("comment_worthy", "").lower() == "yes")
-    sent = sum(1 for l in leads if l.get("sent", "").lower() in ("yes", "true", "1"))
-    pending = len(get_pending_leads(leads))
+    counts = Counter()
+
+    # Single pass over the file
+    for lead in iter_leads():
+        counts["total"] += 1
+        if lead.get("comment_worthy", "").strip().lower() in _YES:
+            counts["comment_worthy"] += 1
+        if lead.get("sent", "").strip().lower() in _TRUTHY:
+            counts["sent"] += 1
+        elif is_pending(lead):
+            counts["pending"] += 1
 
     print(f"\n{'='*60}")
     print("ACTION STATISTICS")
     print("="*60)
-    print(f"Total leads:      {total}")
-    print(f"Comment-worthy:   {comment_worthy}")
-    print(f"Sent:             {sent}")
-    print(f"Pending:          {pending}")
+    print(f"Total leads:      {counts['total']}")
+    print(f"Comment-worthy:   {counts['comment_worthy']}")
+    print(f"Sent:             {counts['sent']}")
+    print(f"Pending:          {counts['pending']}")
     print("="*60)
 
 
@@ -27,6 +27,11 @@ To stop:
 
     # Or use pkill
     pkill -f scheduler.py
+
+Runs happen in-process by default; pass --subprocess to run each scan in a
+fresh interpreter instead (slower, but isolates crashes and memory).
+In-process runs read .env once, when the scheduler starts, so restart it
+after changing settings (--subprocess runs pick changes up on the next run).
 """
 
 import argparse
@@ -35,7 +40,7 @@ import os
 import signal
 import subprocess
 import sys
-import time
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -59,8 +64,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Flag for graceful shutdown
+# Imported once so each run skips interpreter startup and module imports.
+# Its loggers propagate to the handlers configured above.
+from src.main import run as scout_run
+
+# Flag for graceful shutdown (the event wakes the sleeping main loop)
 running = True
+stop_event = threading.Event()
 
 
 def signal_handler(signum, frame):
@@ -68,11 +78,52 @@ def signal_handler(signum, frame):
     global running
     logger.info(f"Received signal {signum}. Shutting down gracefully...")
     running = False
+    stop_event.set()
+
+
+def run_scout(
+    limit: int,
+    analyze: bool,
+    sheets: bool,
+    verbose: bool,
+    concurrency: int | None = None,
+    use_cache: bool = True,
+    use_subprocess: bool = False,
+) -> bool:
+    """
+    Run the Kaiwa Reddit Scout pipeline once.
 
-
-def run_scout(limit: int, analyze: bool, sheets: bool, verbose: bool) -> bool:
+    Returns True if successful, False otherwise.
     """
-    Run the Kaiwa Reddit Scout main script.
+    if use_subprocess:
+        return run_scout_subprocess(limit, analyze, sheets, verbose, concurrency, use_cache)
+
+    logger.info(f"Running scout in-process (limit={limit})")
+    ok = scout_run(
+        limit=limit,
+        analyze=analyze,
+        sheets=sheets,
+        verbose=verbose,
+        concurrency=concurrency,
+        use_cache=use_cache,
+    )
+    if ok:
+        logger.info("Scout completed successfully")
+    else:
+        logger.error("Scout run failed")
+    return ok
+
+
+def run_scout_subprocess(
+    limit: int,
+    analyze: bool,
+    sheets: bool,
+    verbose: bool,
+    concurrency: int | None = None,
+    use_cache: bool = True,
+) -> bool:
+    """
+    Run the Kaiwa Reddit Scout main script in a separate interpreter.
 
     Returns True if successful, False otherwise.
     """
@@ -84,6 +135,10 @@ def run_scout(limit: int, analyze: bool, sheets: bool, verbose: bool) -> bool:
         cmd.append("--sheets")
     if verbose:
         cmd.append("-v")
+    if concurrency:
+        cmd.extend(["--concurrency", str(concurrency)])
+    if not use_cache:
+        cmd.append("--no-cache")
     cmd.extend(["--limit", str(limit)])
 
     logger.info(f"Running: {' '.join(cmd)}")
@@ -97,15 +152,16 @@ def run_scout(limit: int, analyze: bool, sheets: bool, verbose: bool) -> bool:
             timeout=1800  # 30 minute timeout
         )
 
-        if result.stdout:
+        # Relay child output lazily; skip the line split when nothing would be logged
+        if result.stdout and logger.isEnabledFor(logging.INFO):
             for line in result.stdout.strip().split('\n'):
                 if line:
-                    logger.info(f"[scout] {line}")
+                    logger.info("[scout] %s", line)
 
-        if result.stderr:
+        if result.stderr and logger.isEnabledFor(logging.WARNING):
             for line in result.stderr.strip().split('\n'):
                 if line:
-                    logger.warning(f"[scout] {line}")
+                    logger.warning("[scout] %s", line)
 
         if result.returncode == 0:
             logger.info("Scout completed successfully")
@@ -166,6 +222,21 @@ Background usage:
         action="store_true",
         help="Export to Google Sheets"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Max concurrent Gemini requests per run (default: GEMINI_CONCURRENCY or 8)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the Gemini response cache"
+    )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run each scan in a separate Python process"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -195,12 +266,18 @@ Background usage:
     logger.info(f"Limit: {args.limit} posts")
     logger.info(f"AI Analysis: {'enabled' if analyze else 'disabled'}")
     logger.info(f"Google Sheets: {'enabled' if args.sheets else 'disabled'}")
+    if args.concurrency:
+        logger.info(f"Concurrency: {args.concurrency}")
+    logger.info(f"Mode: {'subprocess' if args.subprocess else 'in-process'}")
     logger.info(f"Log file: {LOG_FILE}")
     logger.info("=" * 60)
 
     if args.run_once:
         logger.info("Running once and exiting...")
-        success = run_scout(args.limit, analyze, args.sheets, args.verbose)
+        success = run_scout(
+            args.limit, analyze, args.sheets, args.verbose,
+            args.concurrency, not args.no_cache, args.subprocess,
+        )
         sys.exit(0 if success else 1)
 
     logger.info("Press Ctrl+C to stop")
@@ -214,7 +291,10 @@ Background usage:
         logger.info(f"Run #{run_count} starting at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(f"{'=' * 40}")
 
-        success = run_scout(args.limit, analyze, args.sheets, args.verbose)
+        success = run_scout(
+            args.limit, analyze, args.sheets, args.verbose,
+            args.concurrency, not args.no_cache, args.subprocess,
+        )
         if success:
             success_count += 1
 
@@ -227,10 +307,9 @@ Background usage:
         next_run_str = datetime.fromtimestamp(next_run).strftime('%H:%M:%S')
         logger.info(f"Next run at {next_run_str} (sleeping for {args.interval} minutes)")
 
-        # Sleep in small increments to allow for graceful shutdown
-        sleep_end = time.time() + interval_seconds
-        while running and time.time() < sleep_end:
-            time.sleep(min(10, sleep_end - time.time()))
+        # Sleep until the next run, waking immediately on shutdown
+        if stop_event.wait(interval_seconds):
+            break
 
     logger.info("\n" + "=" * 60)
     logger.info("Scheduler stopped")
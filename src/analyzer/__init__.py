@@ -7,12 +7,32 @@ Phase 2 components:
 - ResponseGenerator: Generate public comment and DM drafts
 """
 
-from src.analyzer.gemini_client import GeminiClient
-from src.analyzer.signal_scorer import SignalScorer
-from src.analyzer.response_generator import ResponseGenerator
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so importing
+# the package stays cheap for callers that never run analysis
+_LAZY_ATTRS = {
+    "GeminiClient": "src.analyzer.gemini_client",
+    "SignalScorer": "src.analyzer.signal_scorer",
+    "ResponseGenerator": "src.analyzer.response_generator",
+}
 
 __all__ = [
     "GeminiClient",
     "SignalScorer",
     "ResponseGenerator",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
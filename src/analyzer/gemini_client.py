@@ -3,41 +3,157 @@ Gemini API client wrapper for lead analysis.
 Uses REST API directly to avoid cryptography dependency issues.
 """
 
+import functools
 import json
 import logging
-import ssl
-from typing import Optional
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generator, Iterable, Iterator, Optional, TypeVar
 import urllib.request
 import urllib.error
 
-# Try to use certifi for SSL certificates (fixes macOS issues)
+# Use orjson for request/response bodies when available (parses bytes directly)
 try:
-    import certifi
-    SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
 except ImportError:
-    SSL_CONTEXT = ssl.create_default_context()
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
+from src.analyzer.gemini_client_session import SSL_CONTEXT, get_session
+from src.analyzer.llm_cache import LLMCache, get_llm_cache
+from src.analyzer.rate_limiter import AdaptiveLimiter
 from src.config.settings import gemini_config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 # Gemini API endpoint
 GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+GEMINI_STREAM_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse"
+
+# Batch API (async jobs, discounted) and its operation polling endpoint
+GEMINI_BATCH_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:batchGenerateContent"
+GEMINI_OPERATION_URL = "https://generativelanguage.googleapis.com/v1beta/{name}"
+BATCH_POLL_SECONDS = 30
+
+# Responses that mean "slow down" (fed back into the adaptive limiter)
+RATE_LIMIT_STATUSES = frozenset({429, 503})
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+# JSON extraction patterns for models without JSON mode (e.g. Gemma)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\[\{].*?[\]\}])\s*```", re.DOTALL)
+_JSON_ANY_RE = re.compile(r"([\[\{].*[\]\}])", re.DOTALL)
+_JSON_START_RE = re.compile(r"[\[\{]")
+_json_decoder = json.JSONDecoder()
+
+def parse_json(text: str):
+    """
+    Parse a JSON model response (with orjson when available).
+
+    Raises:
+        json.JSONDecodeError: If text isn't valid JSON
+    """
+    return _loads(text)
+
+
+def salvage_json(text: str):
+    """
+    Parse a JSON model response, tolerating prose or fences around it.
+
+    Models sometimes append a sentence after the JSON or wrap it in stray
+    markdown. Rather than rejecting the whole response, decode the first
+    complete JSON value and ignore whatever follows it.
+
+    Raises:
+        json.JSONDecodeError: If no JSON value can be recovered
+    """
+    try:
+        return _loads(text)
+    except json.JSONDecodeError as e:
+        error = e
+
+    for match in _JSON_START_RE.finditer(text):
+        try:
+            value, _ = _json_decoder.raw_decode(text, match.start())
+            return value
+        except json.JSONDecodeError:
+            continue
+
+    raise error
+
+
+def dump_json(obj) -> str:
+    """Serialize obj compactly for embedding in a prompt (non-ASCII kept as-is)."""
+    return _dumps(obj).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=16)
+def _generation_config(max_tokens: int, temperature: float, json_mime: bool) -> dict:
+    """
+    Build the generationConfig block for a request.
+
+    Only a handful of combinations are ever used, so each is built once and
+    shared. Callers must treat the returned dict as read-only.
+
+    Args:
+        max_tokens: Maximum tokens in response
+        temperature: Response temperature (0-1)
+        json_mime: Request a JSON response (only supported by Gemini models, not Gemma)
+    """
+    config = {
+        "maxOutputTokens": max_tokens,
+        "temperature": temperature,
+    }
+    if json_mime:
+        config["responseMimeType"] = "application/json"
+    return config
 
 
 class GeminiClient:
     """Wrapper for Google Gemini API using REST."""
 
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+    ):
         """
         Initialize Gemini client.
 
         Args:
             api_key: Gemini API key (default: from env)
             model: Model name (default: from env)
+            concurrency: Max in-flight requests for generate_batch (default: from env)
+            use_cache: Cache responses on disk (default: from env)
         """
         self.api_key = api_key or gemini_config.api_key
         self.model_name = model or gemini_config.model
+        self.concurrency = max(1, concurrency or gemini_config.concurrency)
+
+        # Bounds in-flight HTTP requests across every thread using this client;
+        # the window shrinks on 429s or rising latency and grows back after
+        self.limiter = AdaptiveLimiter(self.concurrency)
+
+        # Token usage from response metadata (cached_tokens = implicit prefix cache hits)
+        self.usage = {"requests": 0, "prompt_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
+        self._usage_lock = threading.Lock()
+
+        if use_cache is None:
+            use_cache = gemini_config.cache_enabled
+        self.cache = get_llm_cache() if use_cache else None
 
         if not self.api_key:
             logger.warning("Gemini API key not set - analysis will be skipped")
@@ -46,7 +162,15 @@ class GeminiClient:
         """Check if the client is properly configured."""
         return bool(self.api_key)
 
-    def _make_request(self, prompt: str, max_tokens: int = 1024, temperature: float = 0.7, json_mode: bool = False, model_override: Optional[str] = None) -> Optional[str]:
+    def _make_request(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        json_mode: bool = False,
+        model_override: Optional[str] = None,
+        response_schema: Optional[dict] = None,
+    ) -> Optional[str]:
         """Make a request to Gemini API.
 
         Args:
@@ -55,13 +179,46 @@ class GeminiClient:
             temperature: Response temperature (0-1)
             json_mode: Whether to request JSON response
             model_override: Optional model to use instead of default
+            response_schema: Optional structured-output schema (JSON mode, Gemini models only)
         """
         if not self.is_configured():
             return None
 
         model = model_override or self.model_name
-        url = GEMINI_API_URL.format(model=model) + f"?key={self.api_key}"
+        url = GEMINI_API_URL.format(model=model)
+        payload = self._build_payload(prompt, model, max_tokens, temperature, json_mode, response_schema)
+
+        cache_key = None
+        if self.cache:
+            cache_key = LLMCache.cache_key(model, prompt, max_tokens, temperature, json_mode, response_schema)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Gemini cache hit ({model})")
+                return cached
+
+        # Latency baselines are per model and output budget
+        result = self._post_json(url, payload, limiter_key=(model, max_tokens))
+        if not result:
+            return None
+
+        self._record_usage(result.get("usageMetadata", {}))
+        text = self._candidate_text(result)
 
+        if text and cache_key:
+            self.cache.set(cache_key, text)
+
+        return text
+
+    @staticmethod
+    def _build_payload(
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        json_mode: bool,
+        response_schema: Optional[dict] = None,
+    ) -> dict:
+        """Build the generateContent request body."""
         payload = {
             "contents": [
                 {
@@ -70,45 +227,207 @@ class GeminiClient:
                     ]
                 }
             ],
-            "generationConfig": {
-                "maxOutputTokens": max_tokens,
-                "temperature": temperature,
-            }
+            "generationConfig": _generation_config(
+                max_tokens, temperature, json_mode and model.startswith("gemini")
+            ),
         }
 
-        # JSON mode only supported by Gemini models, not Gemma
-        if json_mode and model.startswith("gemini"):
-            payload["generationConfig"]["responseMimeType"] = "application/json"
+        if response_schema and json_mode and model.startswith("gemini"):
+            payload["generationConfig"] = {
+                **payload["generationConfig"],
+                "responseSchema": response_schema,
+            }
+
+        return payload
+
+    @staticmethod
+    def _candidate_text(result: dict) -> Optional[str]:
+        """Extract the first candidate's text from a response (or stream chunk)."""
+        candidates = result.get("candidates", [])
+        if candidates:
+            content = candidates[0].get("content", {})
+            parts = content.get("parts", [])
+            if parts:
+                return parts[0].get("text", "")
+        return None
+
+    def _stream_request(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        model_override: Optional[str] = None,
+    ) -> Generator[str, None, bool]:
+        """Stream text chunks from Gemini's server-sent events endpoint.
+
+        The concurrency slot is held until the stream ends, so open streams
+        count against the same in-flight cap as every other request.
+        Rate-limit responses are retried like _send_json (they arrive before
+        any text).
 
+        Returns:
+            (As the generator's return value) True if the response finished,
+            False after an error or a stream cut off mid-response
+        """
+        model = model_override or self.model_name
+        url = GEMINI_STREAM_URL.format(model=model)
+        payload = self._build_payload(prompt, model, max_tokens, temperature, json_mode=False)
+        headers = {"Content-Type": "application/json", "x-goog-api-key": self.api_key}
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self.limiter.acquire()
+            status = None
+            try:
+                with get_session().post(url, data=_dumps(payload), headers=headers, timeout=30, stream=True) as response:
+                    status = response.status_code
+                    if status >= 400:
+                        if status not in RATE_LIMIT_STATUSES:
+                            logger.error(f"Gemini API HTTP error {status}: {response.text}")
+                            return False
+                    else:
+                        usage = {}
+                        finished = False
+                        for line in response.iter_lines():
+                            if not line.startswith(b"data:"):
+                                continue
+                            chunk = _loads(line[5:])
+                            usage = chunk.get("usageMetadata", usage)
+                            finished = finished or self._is_finished(chunk)
+                            text = self._candidate_text(chunk)
+                            if text:
+                                yield text
+
+                        self._record_usage(usage)
+                        if not finished:
+                            logger.error("Gemini API stream ended before the response finished")
+                        return finished
+            except Exception as e:
+                logger.error(f"Gemini API streaming error: {e}")
+                return False
+            finally:
+                # Freed before any backoff below; stream time depends on output
+                # length, so it isn't a latency sample
+                self.limiter.release(throttled=status in RATE_LIMIT_STATUSES)
+
+            if not self._wait_rate_limited(attempt, status):
+                return False
+        return False
+
+    @staticmethod
+    def _is_finished(chunk: dict) -> bool:
+        """Check whether a stream chunk carries the response's finishReason."""
+        candidates = chunk.get("candidates", [])
+        return bool(candidates and candidates[0].get("finishReason"))
+
+    def _record_usage(self, metadata: dict):
+        """Accumulate token counts from a response's usageMetadata."""
+        with self._usage_lock:
+            self.usage["requests"] += 1
+            self.usage["prompt_tokens"] += metadata.get("promptTokenCount", 0)
+            self.usage["cached_tokens"] += metadata.get("cachedContentTokenCount", 0)
+            self.usage["output_tokens"] += metadata.get("candidatesTokenCount", 0)
+
+    def _post_json(self, url: str, payload: dict, limiter_key: Optional[tuple] = None) -> Optional[dict]:
+        """POST a JSON payload and return the decoded response (None on error).
+
+        With a limiter_key, each attempt holds a concurrency slot (see _send_json).
+        """
+        return self._send_json("POST", url, _dumps(payload), limiter_key)
+
+    def _get_json(self, url: str) -> Optional[dict]:
+        """GET a resource and return the decoded response (None on error)."""
+        return self._send_json("GET", url)
+
+    def _send_json(
+        self, method: str, url: str, data: Optional[bytes] = None, limiter_key: Optional[tuple] = None
+    ) -> Optional[dict]:
+        """Send a request and return the decoded JSON response (None on error).
+
+        Rate-limit responses shrink the concurrency window and are retried
+        with jittered exponential backoff, so a burst of 429s costs a short
+        wait rather than a failed call (and a pile of fallback requests).
+
+        With a limiter_key, each attempt holds a concurrency slot and reports
+        its latency under that key; the slot is freed before backing off, so
+        the wait is neither held against other requests nor counted as latency.
+        """
+        # Send the key as a header so it never shows up in URLs or error messages
+        headers = {"Content-Type": "application/json", "x-goog-api-key": self.api_key}
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            if limiter_key is None:
+                status, result = self._send_once(method, url, data, headers)
+                if status in RATE_LIMIT_STATUSES:
+                    self.limiter.throttled()
+            else:
+                self.limiter.acquire()
+                start = time.monotonic()
+                status = None
+                try:
+                    status, result = self._send_once(method, url, data, headers)
+                finally:
+                    if status in RATE_LIMIT_STATUSES:
+                        self.limiter.release(throttled=True)
+                    else:
+                        self.limiter.release(time.monotonic() - start, limiter_key)
+
+            if status not in RATE_LIMIT_STATUSES:
+                return result
+            if not self._wait_rate_limited(attempt, status):
+                return None
+        return None
+
+    @staticmethod
+    def _wait_rate_limited(attempt: int, status: int) -> bool:
+        """
+        Sleep before retrying a rate-limited request (jittered exponential backoff).
+
+        Returns:
+            False (without sleeping) once the retries are used up
+        """
+        if attempt >= RATE_LIMIT_RETRIES:
+            logger.error(f"Gemini API still rate limited after {RATE_LIMIT_RETRIES} retries")
+            return False
+
+        delay = RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt
+        delay += random.uniform(0, delay)
+        logger.warning(f"Gemini API rate limited ({status}), retrying in {delay:.1f}s")
+        time.sleep(delay)
+        return True
+
+    def _send_once(
+        self, method: str, url: str, data: Optional[bytes], headers: dict
+    ) -> tuple[Optional[int], Optional[dict]]:
+        """Send one request; returns (HTTP error status or None, decoded response or None)."""
         try:
-            data = json.dumps(payload).encode('utf-8')
+            session = get_session()
+            if session is not None:
+                response = session.request(method, url, data=data, headers=headers, timeout=30)
+                if response.status_code >= 400:
+                    if response.status_code not in RATE_LIMIT_STATUSES:
+                        logger.error(f"Gemini API HTTP error {response.status_code}: {response.text}")
+                    return response.status_code, None
+                return None, _loads(response.content)
+
+            # Fallback for environments without requests
             req = urllib.request.Request(
                 url,
                 data=data,
-                headers={"Content-Type": "application/json"},
-                method="POST"
+                headers=headers,
+                method=method
             )
 
             with urllib.request.urlopen(req, timeout=30, context=SSL_CONTEXT) as response:
-                result = json.loads(response.read().decode('utf-8'))
-
-            # Extract text from response
-            candidates = result.get("candidates", [])
-            if candidates:
-                content = candidates[0].get("content", {})
-                parts = content.get("parts", [])
-                if parts:
-                    return parts[0].get("text", "")
-
-            return None
+                return None, _loads(response.read())
 
         except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8') if e.fp else str(e)
-            logger.error(f"Gemini API HTTP error {e.code}: {error_body}")
-            return None
+            if e.code not in RATE_LIMIT_STATUSES:
+                error_body = e.read().decode('utf-8') if e.fp else str(e)
+                logger.error(f"Gemini API HTTP error {e.code}: {error_body}")
+            return e.code, None
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
-            return None
+            return None, None
 
     def generate(self, prompt: str, max_tokens: int = 1024, model: Optional[str] = None) -> Optional[str]:
         """
@@ -124,7 +443,62 @@ class GeminiClient:
         """
         return self._make_request(prompt, max_tokens, temperature=0.7, model_override=model)
 
-    def generate_json(self, prompt: str, max_tokens: int = 1024, model: Optional[str] = None) -> Optional[str]:
+    def generate_stream(self, prompt: str, max_tokens: int = 1024, model: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate text using Gemini, yielding chunks as they arrive.
+
+        Falls back to a single chunk from generate() when the requests
+        session isn't available. Responses that finished are cached like
+        generate(); a stream interrupted by an error ends early and isn't cached.
+
+        Args:
+            prompt: The prompt to send
+            max_tokens: Maximum tokens in response
+            model: Optional model override
+
+        Yields:
+            Text chunks (nothing on error)
+        """
+        if not self.is_configured():
+            return
+
+        model = model or self.model_name
+        cache_key = None
+        if self.cache:
+            cache_key = LLMCache.cache_key(model, prompt, max_tokens, 0.7, False)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        if get_session() is None:
+            text = self._make_request(prompt, max_tokens, temperature=0.7, model_override=model)
+            if text:
+                yield text
+            return
+
+        chunks = []
+        stream = self._stream_request(prompt, max_tokens, temperature=0.7, model_override=model)
+        while True:
+            try:
+                chunk = next(stream)
+            except StopIteration as done:
+                completed = done.value
+                break
+            chunks.append(chunk)
+            yield chunk
+
+        # A stream cut off mid-response must not be served from the cache later
+        if completed and chunks and cache_key:
+            self.cache.set(cache_key, "".join(chunks))
+
+    def generate_json(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        model: Optional[str] = None,
+        schema: Optional[dict] = None,
+    ) -> Optional[str]:
         """
         Generate JSON response using Gemini.
 
@@ -132,11 +506,178 @@ class GeminiClient:
             prompt: The prompt (should ask for JSON output)
             max_tokens: Maximum tokens in response
             model: Optional model override
+            schema: Optional response schema to enforce (ignored by Gemma models)
 
         Returns:
             Generated JSON string or None on error
         """
-        response = self._make_request(prompt, max_tokens, temperature=0.3, json_mode=True, model_override=model)
+        response = self._make_request(
+            prompt, max_tokens, temperature=0.3, json_mode=True, model_override=model, response_schema=schema
+        )
+        return self._extract_json(response)
+
+    def generate_batch(
+        self,
+        prompts: list[str],
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        json_mode: bool = False,
+        model: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        schema: Optional[dict] = None,
+    ) -> list[Optional[str]]:
+        """
+        Generate responses for many prompts concurrently.
+
+        Requests are fanned out over a thread pool so network round-trips
+        overlap instead of running back to back.
+
+        Args:
+            prompts: Prompts to send
+            max_tokens: Maximum tokens in each response
+            temperature: Response temperature (0-1)
+            json_mode: Whether to request (and extract) JSON responses
+            model: Optional model override
+            concurrency: Max in-flight requests (default: client setting)
+            schema: Optional response schema for JSON mode (ignored by Gemma models)
+
+        Returns:
+            Responses in the same order as prompts (None for failures)
+        """
+        if not prompts:
+            return []
+
+        def run(prompt: str) -> Optional[str]:
+            response = self._make_request(
+                prompt,
+                max_tokens,
+                temperature=temperature,
+                json_mode=json_mode,
+                model_override=model,
+                response_schema=schema,
+            )
+            return self._extract_json(response) if json_mode else response
+
+        return self.map_concurrent(run, prompts, concurrency=concurrency)
+
+    def generate_batch_job(
+        self,
+        jobs: list[tuple[str, int]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        display_name: str = "kaiwa-scout",
+    ) -> list[Optional[str]]:
+        """
+        Run many prompts as one asynchronous Gemini Batch API job.
+
+        Batch jobs are billed at a discount and scheduled server-side, but
+        can take minutes to complete, so this is meant for large runs.
+        Cached prompts are answered locally and left out of the job.
+
+        Args:
+            jobs: (prompt, max_tokens) pairs
+            model: Optional model override
+            temperature: Response temperature (0-1)
+            display_name: Job name shown in AI Studio
+
+        Returns:
+            Responses in the same order as jobs (None for failures or
+            anything unfinished when GEMINI_BATCH_TIMEOUT expires)
+        """
+        if not jobs or not self.is_configured():
+            return [None] * len(jobs)
+
+        model = model or self.model_name
+        results: list[Optional[str]] = [None] * len(jobs)
+        requests_body = []
+        for index, (prompt, max_tokens) in enumerate(jobs):
+            if self.cache:
+                cached = self.cache.get(LLMCache.cache_key(model, prompt, max_tokens, temperature, False))
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            requests_body.append({
+                "request": self._build_payload(prompt, model, max_tokens, temperature, json_mode=False),
+                "metadata": {"key": str(index)},
+            })
+
+        if not requests_body:
+            return results
+
+        logger.info(f"Submitting Gemini batch job with {len(requests_body)} requests ({model})...")
+        operation = self._post_json(
+            GEMINI_BATCH_URL.format(model=model),
+            {
+                "batch": {
+                    "display_name": display_name,
+                    "input_config": {"requests": {"requests": requests_body}},
+                }
+            },
+        )
+        if not operation or "name" not in operation:
+            logger.error("Gemini batch job submission failed")
+            return results
+
+        name = operation["name"]
+        deadline = time.monotonic() + gemini_config.batch_timeout_seconds
+        while not operation.get("done"):
+            if time.monotonic() >= deadline:
+                logger.warning(f"Gemini batch job {name} still running after timeout - giving up on it")
+                return results
+            time.sleep(BATCH_POLL_SECONDS)
+            operation = self._get_json(GEMINI_OPERATION_URL.format(name=name)) or operation
+
+        if "error" in operation:
+            logger.error(f"Gemini batch job {name} failed: {operation['error']}")
+            return results
+
+        output = operation.get("response") or operation.get("metadata", {}).get("output", {})
+        for item in output.get("inlinedResponses", {}).get("inlinedResponses", []):
+            index = int(item.get("metadata", {}).get("key", -1))
+            if not 0 <= index < len(jobs) or "response" not in item:
+                continue
+            self._record_usage(item["response"].get("usageMetadata", {}))
+            text = self._candidate_text(item["response"])
+            results[index] = text
+            if text and self.cache:
+                prompt, max_tokens = jobs[index]
+                self.cache.set(LLMCache.cache_key(model, prompt, max_tokens, temperature, False), text)
+
+        logger.info(f"Gemini batch job {name} done: {sum(r is not None for r in results)}/{len(jobs)} responses")
+        return results
+
+    def map_concurrent(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        concurrency: Optional[int] = None,
+    ) -> list[R]:
+        """
+        Apply func to each item on a thread pool, preserving order.
+
+        Use this to run several Gemini calls per item (e.g. one lead's
+        drafts) concurrently. HTTP requests stay bounded by the client's
+        concurrency however many threads call in.
+
+        Args:
+            func: Function to call for each item
+            items: Items to process
+            concurrency: Max worker threads (default: client setting)
+
+        Returns:
+            Results in the same order as items
+        """
+        items = list(items)
+        workers = min(concurrency or self.concurrency, len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _extract_json(response: Optional[str]) -> Optional[str]:
+        """Extract the JSON payload from a model response."""
         if not response:
             return None
 
@@ -149,13 +690,12 @@ class GeminiClient:
             return response
 
         # Look for JSON block in markdown code fence
-        import re
-        json_match = re.search(r"```(?:json)?\s*([\[\{].*?[\]\}])\s*```", response, re.DOTALL)
+        json_match = _JSON_FENCE_RE.search(response)
         if json_match:
             return json_match.group(1)
 
         # Look for JSON object or array anywhere in response
-        json_match = re.search(r"([\[\{].*[\]\}])", response, re.DOTALL)
+        json_match = _JSON_ANY_RE.search(response)
         if json_match:
             return json_match.group(1)
 
@@ -172,9 +712,6 @@ def get_gemini_client() -> GeminiClient:
         _gemini_client = GeminiClient()
     return _gemini_client
 
-# For backwards compatibility
-gemini_client = None  # Will be set on first use
-
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
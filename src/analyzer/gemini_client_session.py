@@ -0,0 +1,77 @@
+"""
+Shared HTTP session for Gemini API calls.
+
+One pooled keep-alive session is created on first use and shared by every
+GeminiClient and worker thread, so calls after the first reuse open TLS
+connections instead of handshaking again. It is closed at interpreter exit.
+"""
+
+import atexit
+import ssl
+import threading
+
+# Try to use certifi for SSL certificates (fixes macOS issues)
+try:
+    import certifi
+    SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+except ImportError:
+    SSL_CONTEXT = ssl.create_default_context()
+
+# Gemini speaks TLS 1.3, which needs one fewer round trip per handshake
+if ssl.HAS_TLSv1_3:
+    SSL_CONTEXT.minimum_version = ssl.TLSVersion.TLSv1_3
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    class _SSLContextAdapter(HTTPAdapter):
+        """HTTPAdapter whose pooled connections use SSL_CONTEXT."""
+
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs["ssl_context"] = SSL_CONTEXT
+            return super().init_poolmanager(*args, **kwargs)
+
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+from src.config.settings import gemini_config
+
+# Keep-alive connections per host (never fewer than the request concurrency)
+MIN_POOL_SIZE = 16
+
+# Shared session (lazy loaded)
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Get or create the shared pooled session.
+
+    Returns:
+        requests.Session, or None if requests isn't installed
+    """
+    global _session
+    if not HAS_REQUESTS:
+        return None
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = max(MIN_POOL_SIZE, gemini_config.concurrency)
+                session = requests.Session()
+                session.mount("https://", _SSLContextAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+                _session = session
+                atexit.register(close_session)
+    return _session
+
+
+def close_session():
+    """Close the shared session and its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,110 @@
+"""
+On-disk cache for LLM responses.
+
+Posts reappear across scheduler runs, so identical requests are answered
+from a local SQLite file instead of another API call.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.config.settings import app_config, gemini_config
+
+logger = logging.getLogger(__name__)
+
+# Default cache location
+CACHE_PATH = app_config.data_dir / ".gemini_cache.sqlite"
+
+
+class LLMCache:
+    """SQLite-backed cache of LLM responses keyed by SHA-256 of the request."""
+
+    def __init__(self, path: Path = CACHE_PATH, ttl_seconds: Optional[int] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path
+            ttl_seconds: How long cached entries stay valid (default: from env)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds or gemini_config.cache_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+        # One connection shared by worker threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, ts INTEGER)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def cache_key(
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        json_mode: bool,
+        response_schema: Optional[dict] = None,
+    ) -> str:
+        """Hash the request parameters into a cache key."""
+        raw = json.dumps(
+            {
+                "model": model,
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "json_mode": json_mode,
+                "response_schema": response_schema,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute("SELECT value, ts FROM cache WHERE key = ?", (key,)).fetchone()
+            if row and time.time() - row[1] < self.ttl_seconds:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: str):
+        """Store a value."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+            self._conn.commit()
+
+    @property
+    def stats(self) -> dict:
+        """Hit/miss counters for this process."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+# Shared cache instance (lazy loaded, shared by all clients)
+_llm_cache = None
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Get or open the shared LLM cache (None if it can't be opened)."""
+    global _llm_cache
+    if _llm_cache is None:
+        try:
+            _llm_cache = LLMCache()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache disabled: {e}")
+            return None
+    return _llm_cache
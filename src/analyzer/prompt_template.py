@@ -0,0 +1,48 @@
+"""
+Precompiled prompt templates.
+
+str.format re-parses the whole template on every call. compile_template
+parses it once and returns a function that only joins the pieces.
+
+Prompt templates keep all static instructions first and the per-lead details
+last, so Gemini's implicit prefix caching can reuse the shared prefix across
+calls.
+"""
+
+from string import Formatter
+from typing import Callable
+
+_formatter = Formatter()
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Compile a str.format-style template into a render function.
+
+    The returned function takes the template's fields as keyword arguments
+    and produces the same string as template.format(**kwargs).
+
+    Args:
+        template: Template using {field} placeholders ({{ and }} for braces)
+
+    Returns:
+        Render function
+    """
+    literals = []
+    fields = []
+    for literal, field_name, format_spec, conversion in _formatter.parse(template):
+        literals.append(literal)
+        if field_name is not None:
+            fields.append((len(literals), field_name, format_spec, conversion))
+            literals.append("")
+
+    def render(**kwargs) -> str:
+        parts = literals.copy()
+        for index, name, format_spec, conversion in fields:
+            value = kwargs[name]
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            parts[index] = format(value, format_spec) if format_spec else str(value)
+        return "".join(parts)
+
+    return render
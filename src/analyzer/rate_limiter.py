@@ -0,0 +1,116 @@
+"""
+Adaptive concurrency limit for Gemini requests.
+
+A fixed semaphore either trips Gemini's rate limits (429) when set too high
+or leaves capacity unused when set too low. AdaptiveLimiter starts at the
+configured concurrency and adjusts from feedback (AIMD):
+
+- a fast success grows the window by 1/limit (about +1 per full window)
+- a response much slower than the best seen for the same kind of request
+  shrinks it by one (Vegas-style queueing signal); baselines are kept per
+  request kind because a 1k-token draft is always slower than a short
+  scoring call
+- a 429/503 halves it
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Hashable, Iterator, Optional
+
+
+class AdaptiveLimiter:
+    """Thread-safe concurrency limiter with an AIMD-adjusted window."""
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        backoff: float = 0.5,
+        latency_tolerance: float = 3.0,
+        cooldown_seconds: float = 1.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_limit: Upper bound (and starting value) for in-flight requests
+            min_limit: Lower bound for in-flight requests
+            backoff: Factor applied to the window on a rate-limit response
+            latency_tolerance: Latency above this multiple of the best seen (per key) counts as queueing
+            cooldown_seconds: Minimum time between two decreases (one burst of 429s = one cut)
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.cooldown_seconds = cooldown_seconds
+
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.throttle_count = 0
+        self._min_latency: dict[Hashable, float] = {}  # Best latency seen per request key
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Block until the window has room for another request."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency: Optional[float] = None, key: Hashable = None, throttled: bool = False):
+        """
+        Free a slot and feed its outcome back into the window.
+
+        Args:
+            latency: Seconds the request took (None = no latency signal)
+            key: Kind of request (e.g. model and max_tokens); latency is only
+                compared with earlier requests of the same kind
+            throttled: The request was rate limited (cuts the window like throttled())
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                self._throttled()
+            elif latency is not None:
+                best = self._min_latency.get(key)
+                if best is None or latency < best:
+                    self._min_latency[key] = best = latency
+                if latency > best * self.latency_tolerance:
+                    self._decrease(self.limit - 1)
+                else:
+                    self._increase()
+            else:
+                self._increase()
+            self._cond.notify_all()
+
+    def throttled(self):
+        """Record a rate-limit response and cut the window."""
+        with self._cond:
+            self._throttled()
+
+    @contextmanager
+    def use(self, key: Hashable = None) -> Iterator[None]:
+        """Hold a slot for the duration of the block, reporting its latency under key."""
+        self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - start, key)
+
+    def _throttled(self):
+        self.throttle_count += 1
+        self._decrease(self.limit * self.backoff)
+
+    def _increase(self):
+        self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+    def _decrease(self, new_limit: float):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown_seconds:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), new_limit)
@@ -2,27 +2,29 @@
 Response draft generator for Reddit leads using Gemini.
 """
 
+import hashlib
 import json
 import logging
 import random
+import re
+import threading
 from typing import Optional
 
-from src.analyzer.gemini_client import GeminiClient
+from src.analyzer.gemini_client import GeminiClient, get_gemini_client, parse_json
+from src.analyzer.prompt_template import compile_template
+from src.analyzer.signal_scorer import SignalScorer, parse_score
+from src.analyzer.tokens import MAX_BODY_TOKENS, truncate_to_tokens
+from src.analyzer.worthiness_classifier import get_worthiness_classifier, record_label
 from src.config.settings import gemini_config
 from src.storage.models import Lead
 
 logger = logging.getLogger(__name__)
 
+# Static instructions first, lead details last (see prompt_template)
+
 # Comment worthiness evaluation prompt
 COMMENT_WORTHY_PROMPT = """Evaluate if this Reddit post is worth commenting on for a language learning app that helps with speaking practice.
 
-POST DETAILS:
-- Subreddit: r/{subreddit}
-- Title: {title}
-- Body: {body}
-- Signal score: {signal_score}/10
-- Category: {category}
-
 CRITERIA FOR WORTH COMMENTING:
 1. The user has a SPECIFIC, ACTIONABLE problem we can help with (not just venting)
 2. They're open to suggestions (asking for advice, not just sharing frustration)
@@ -40,14 +42,17 @@ NOT WORTH COMMENTING IF:
 
 Respond with ONLY a JSON object:
 {{"worthy": true/false, "reason": "<brief 1-sentence explanation>"}}
+
+POST DETAILS:
+- Subreddit: r/{subreddit}
+- Title: {title}
+- Body: {body}
+- Signal score: {signal_score}/10
+- Category: {category}
 """
 
 # Public comment prompt
-PUBLIC_DRAFT_PROMPT = """Write a Reddit comment responding to this post as someone who genuinely uses language learning tools.
-
-POST:
-r/{subreddit}: {title}
-{body}
+PUBLIC_DRAFT_PROMPT = """Write a Reddit comment responding to the post below as someone who genuinely uses language learning tools.
 
 CONTEXT:
 You're a language learner who has tried many tools and wants to share what actually works. You use Kaiwa (trykaiwa.com) for conversation practice but don't push it - only mention if genuinely relevant.
@@ -74,14 +79,14 @@ GOOD EXAMPLE (specific, actually helpful):
 "for mandarin AI, skip chatgpt and go straight for deepseek or qwen. qwen especially is way better at natural chinese. i tried chatgpt for creating dialogues and it starts hallucinating halfway through. if you want something that saves your progress like a lesson plan there's kaiwa (trykaiwa) but the free chinese LLMs are solid for quick practice."
 
 Write ONLY the comment, nothing else.
-"""
-
-# Value-only prompt (no Kaiwa mention) for building genuine credibility
-VALUE_ONLY_PROMPT = """Write a Reddit comment responding to this post as someone who genuinely helps language learners.
 
 POST:
 r/{subreddit}: {title}
 {body}
+"""
+
+# Value-only prompt (no Kaiwa mention) for building genuine credibility
+VALUE_ONLY_PROMPT = """Write a Reddit comment responding to the post below as someone who genuinely helps language learners.
 
 CONTEXT:
 You're an experienced language learner who wants to share what actually works. Give genuinely helpful advice based on your experience.
@@ -106,6 +111,10 @@ GOOD EXAMPLE:
 "for mandarin AI, skip chatgpt and go straight for deepseek or qwen. qwen especially is way better at natural chinese. i tried chatgpt for creating dialogues and it starts hallucinating halfway through. the free chinese LLMs are honestly solid for quick practice sessions."
 
 Write ONLY the comment, nothing else.
+
+POST:
+r/{subreddit}: {title}
+{body}
 """
 
 # Variety of natural Kaiwa mention formats (rotated to avoid pattern detection)
@@ -120,11 +129,6 @@ KAIWA_MENTION_TEMPLATES = [
 # DM prompt
 DM_DRAFT_PROMPT = """You are helping draft a friendly direct message to a Reddit user who might benefit from a language speaking practice app.
 
-USER CONTEXT:
-- Their post: "{title}"
-- Their struggle: {category}
-- Language they're learning: {language}
-
 Write a warm, personal DM that:
 1. References their specific post and struggle
 2. Mentions you're working on Kaiwa, an app for speaking practice with AI tutors
@@ -134,9 +138,112 @@ Write a warm, personal DM that:
 6. Ends with a low-pressure invitation
 
 Write ONLY the message text, no subject line or explanations.
+
+USER CONTEXT:
+- Their post: "{title}"
+- Their struggle: {category}
+- Language they're learning: {language}
 """
 
 
+# Cheap pre-checks that rule a lead out before asking Gemini (see the
+# "NOT WORTH COMMENTING IF" list in COMMENT_WORTHY_PROMPT)
+MIN_WORTHY_BODY_LENGTH = 80
+MIN_WORTHY_SIGNAL_SCORE = 5
+_GRAMMAR_RE = re.compile(r"\b(grammar|vocabulary|conjugation|kanji)\b", re.IGNORECASE)
+_SPEAKING_RE = re.compile(r"\b(speak\w*|conversation\w*|talk\w*|pronunciation|fluen\w+)\b", re.IGNORECASE)
+
+# Fused prompt: scoring, worthiness and both drafts in a single call
+FUSED_ANALYSIS_PROMPT = """You are analyzing a Reddit post for Kaiwa, a language learning app that helps people practice speaking with AI tutors. In ONE response, score the post as a lead, decide if it's worth commenting on, and draft a public comment and a DM.
+
+SCORING (1-10, adjust for urgency and willingness to pay):
+- +3 POINTS for job/relocation/visa urgency
+- +2 POINTS for tutor cost complaints (willing to pay)
+- +2 POINTS for anxiety/embarrassment in real situations
+- -5 POINTS for "free" resource requests (will never pay)
+- 8-10 (HIGH): Speaking anxiety OR urgent deadline OR willing to pay
+- 5-7 (MEDIUM): Some challenges but no urgency/payment signals
+- 1-4 (LOW): General learning or free hunters
+
+CATEGORIES: "Speaking Anxiety", "Practice Gap", "Immersion Prep", "Plateau Frustration", "App Fatigue", "General Learning"
+
+WORTH COMMENTING only if the user has a specific, actionable problem, is open to suggestions, and a genuine helpful comment would add value. NOT worth it if they're just venting/celebrating, the post is very short or vague, it's about grammar/vocabulary rather than speaking, or they want resources we can't provide.
+
+PUBLIC COMMENT (only if score >= {threshold} and worth commenting, otherwise ""):
+- Actually answer their question, like a real learner sharing experience, not a marketer
+- Direct and specific, casual, lowercase is fine, 2-4 sentences
+- NO emojis, NO formatting, NO cheerleader phrases, NO generic advice
+- {mention_rule}
+
+DM (only if score >= {threshold} and worth commenting, otherwise ""):
+- Warm and personal, references their post and struggle, under 100 words
+- Mentions you're working on Kaiwa and offers a free try, low-pressure, not salesy
+
+Respond with ONLY a JSON object:
+{{"score": <1-10>, "signal_type": "<HIGH|MEDIUM|LOW>", "category": "<category>", "worthy": true/false, "reason": "<brief 1-sentence explanation>", "public_draft": "<comment or empty>", "dm_draft": "<dm or empty>"}}
+
+POST:
+r/{subreddit}: {title}
+{body}
+Matched keywords: {triggers}
+Language: {language}
+"""
+
+# Structured-output schemas (Gemini models only; Gemma falls back to JSON extraction)
+COMMENT_WORTHY_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "worthy": {"type": "BOOLEAN"},
+        "reason": {"type": "STRING"},
+    },
+    "required": ["worthy", "reason"],
+}
+
+FUSED_ANALYSIS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "score": {"type": "INTEGER"},
+        "signal_type": {"type": "STRING", "enum": ["HIGH", "MEDIUM", "LOW"]},
+        "category": {"type": "STRING"},
+        "worthy": {"type": "BOOLEAN"},
+        "reason": {"type": "STRING"},
+        "public_draft": {"type": "STRING"},
+        "dm_draft": {"type": "STRING"},
+    },
+    "required": ["score", "signal_type", "category", "worthy", "reason", "public_draft", "dm_draft"],
+}
+
+# Mention rules for the fused prompt's public comment
+FUSED_MENTION_RULE = 'If genuinely relevant, end with a natural mention like "{template}" - never forced'
+FUSED_NO_MENTION_RULE = "NO product recommendations or app mentions"
+
+# Lead fields filled in by generate_responses_batch (copied onto duplicates)
+RESPONSE_FIELDS = (
+    "comment_worthy",
+    "comment_worthy_reason",
+    "public_draft",
+    "dm_draft",
+    "kaiwa_mention_allowed",
+)
+
+# Templates compiled once at import (str.format re-parses on every call).
+# The promotional prompt gets one renderer per mention template.
+render_comment_worthy = compile_template(COMMENT_WORTHY_PROMPT)
+render_value_only = compile_template(VALUE_ONLY_PROMPT)
+render_dm_draft = compile_template(DM_DRAFT_PROMPT)
+render_fused_analysis = compile_template(FUSED_ANALYSIS_PROMPT)
+PUBLIC_DRAFT_RENDERERS = [
+    compile_template(PUBLIC_DRAFT_PROMPT.replace(KAIWA_MENTION_TEMPLATES[0], mention_template))
+    for mention_template in KAIWA_MENTION_TEMPLATES
+]
+
+
+def content_hash(lead: Lead) -> str:
+    """Hash a lead's subreddit, title and body (as sent to Gemini) for dedup."""
+    raw = "\0".join((lead.subreddit, lead.title, truncate_to_tokens(lead.body, MAX_BODY_TOKENS)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 class ResponseGenerator:
     """Generate response drafts for Reddit leads using Gemini."""
 
@@ -147,9 +254,12 @@ class ResponseGenerator:
         Args:
             client: Gemini client (default: global client)
         """
-        self.client = client or GeminiClient()
+        self.client = client or get_gemini_client()
         self.response_model = gemini_config.response_model
         self.require_comment_worthy = gemini_config.require_comment_worthy
+        self.heuristic_skips = 0  # Leads ruled out without an API call (per batch)
+        self._skips_lock = threading.Lock()  # Worthiness checks run on worker threads
+        self.classifier = get_worthiness_classifier()  # Optional local model, asked before Gemini
 
     def evaluate_comment_worthy(self, lead: Lead) -> tuple[bool, str]:
         """
@@ -166,24 +276,119 @@ class ResponseGenerator:
         if not self.client.is_configured():
             return True, "Skipped evaluation - API not configured"
 
-        prompt = COMMENT_WORTHY_PROMPT.format(
+        verdict = self._local_worthiness(lead)
+        if verdict:
+            return verdict
+
+        # Use default model (Gemma) for evaluation - it's cheaper
+        response = self.client.generate_json(
+            self._comment_worthy_prompt(lead), max_tokens=200, schema=COMMENT_WORTHY_SCHEMA
+        )
+        return self._parse_comment_worthy(lead, response)
+
+    def _local_worthiness(self, lead: Lead) -> Optional[tuple[bool, str]]:
+        """Decide worthiness without Gemini if possible (heuristics, cache, classifier)."""
+        return (
+            self._precheck_worthiness(lead)
+            or self._cached_worthiness(lead)
+            or self._classify_worthiness(lead)
+        )
+
+    def _precheck_worthiness(self, lead: Lead) -> Optional[tuple[bool, str]]:
+        """Rule out obviously unworthy leads without an API call.
+
+        Returns:
+            (False, reason) if a heuristic rejects the lead, otherwise None
+        """
+        reason = None
+        if len(lead.body.strip()) < MIN_WORTHY_BODY_LENGTH:
+            reason = "Very short post with no real substance to engage with"
+        elif lead.signal_score is not None and lead.signal_score < MIN_WORTHY_SIGNAL_SCORE:
+            reason = f"Signal score too low ({lead.signal_score}/10)"
+        else:
+            text = f"{lead.title}\n{lead.body}"
+            if _GRAMMAR_RE.search(text) and not _SPEAKING_RE.search(text):
+                reason = "Asking about grammar/vocabulary, not speaking practice"
+
+        if reason is None:
+            return None
+
+        with self._skips_lock:
+            self.heuristic_skips += 1
+        logger.info(f"Comment worthy evaluation for {lead.post_id} (heuristic): False - {reason}")
+        return False, reason
+
+    def _cached_worthiness(self, lead: Lead) -> Optional[tuple[bool, str]]:
+        """Return a previous worthiness verdict for this post, if cached."""
+        if not self.client.cache:
+            return None
+
+        cached = self.client.cache.get(f"worthy:{lead.post_id}")
+        if not cached:
+            return None
+
+        result = parse_json(cached)
+        logger.info(f"Comment worthy evaluation for {lead.post_id} (cached): {result['worthy']} - {result['reason']}")
+        return result["worthy"], result["reason"]
+
+    def _cached_responses(self, digest: str) -> Optional[dict]:
+        """Return responses stored for identical content on an earlier run."""
+        if not self.client.cache:
+            return None
+        cached = self.client.cache.get(f"content:{digest}")
+        return parse_json(cached) if cached else None
+
+    def _cache_responses(self, digest: str, lead: Lead):
+        """Store a lead's finished responses under its content hash."""
+        if not self.client.cache:
+            return
+        finished = lead.comment_worthy is False or (lead.public_draft and lead.dm_draft)
+        if finished:
+            responses = {name: getattr(lead, name) for name in RESPONSE_FIELDS}
+            self.client.cache.set(f"content:{digest}", json.dumps(responses))
+
+    def _classify_worthiness(self, lead: Lead) -> Optional[tuple[bool, str]]:
+        """Ask the local classifier, if one is loaded and it's confident."""
+        if not self.classifier:
+            return None
+
+        result = self.classifier.classify(f"{lead.title}\n{lead.body}")
+        if result is None:
+            return None
+
+        worthy, confidence = result
+        reason = f"Local classifier ({confidence:.0%} confident)"
+        logger.info(f"Comment worthy evaluation for {lead.post_id} (classifier): {worthy} - {reason}")
+        return worthy, reason
+
+    def _comment_worthy_prompt(self, lead: Lead) -> str:
+        """Build the comment-worthiness prompt for a lead."""
+        return render_comment_worthy(
             subreddit=lead.subreddit,
             title=lead.title,
-            body=lead.body[:1000],
+            body=truncate_to_tokens(lead.body, MAX_BODY_TOKENS),
             signal_score=lead.signal_score or "N/A",
             category=lead.category or "General Learning",
         )
 
+    def _parse_comment_worthy(self, lead: Lead, response: Optional[str]) -> tuple[bool, str]:
+        """Parse a comment-worthiness response into (is_worthy, reason)."""
         try:
-            # Use default model (Gemma) for evaluation - it's cheaper
-            response = self.client.generate_json(prompt, max_tokens=200)
             if not response:
                 return True, "Evaluation failed - defaulting to worthy"
 
-            result = json.loads(response)
+            result = parse_json(response)
             worthy = result.get("worthy", True)
             reason = result.get("reason", "No reason provided")
 
+            record_label(f"{lead.title}\n{lead.body}", worthy, reason)
+
+            # The same post shouldn't be re-evaluated on later runs
+            if self.client.cache:
+                self.client.cache.set(
+                    f"worthy:{lead.post_id}", json.dumps({"worthy": worthy, "reason": reason})
+                )
+
             logger.info(f"Comment worthy evaluation for {lead.post_id}: {worthy} - {reason}")
             return worthy, reason
 
@@ -210,36 +415,42 @@ class ResponseGenerator:
         if not self.client.is_configured():
             return None, False
 
+        prompt, include_kaiwa = self._public_draft_prompt(lead)
+
+        # Use response_model for better quality output
+        draft = "".join(self.client.generate_stream(prompt, max_tokens=500, model=self.response_model))
+        return draft or None, include_kaiwa
+
+    def _public_draft_prompt(self, lead: Lead) -> tuple[str, bool]:
+        """Build the public comment prompt for a lead.
+
+        Returns:
+            Tuple of (prompt, whether Kaiwa mention is allowed)
+        """
         # Probability-based selection: mostly pure value, occasionally with Kaiwa mention
         mention_probability = gemini_config.kaiwa_mention_probability
         include_kaiwa = random.random() < mention_probability
 
         if include_kaiwa:
             # Use the promotional prompt (may mention Kaiwa naturally)
-            # Inject a random mention template for variety
-            mention_template = random.choice(KAIWA_MENTION_TEMPLATES)
-            prompt = PUBLIC_DRAFT_PROMPT.format(
+            # with a random mention template for variety
+            render_public_draft = random.choice(PUBLIC_DRAFT_RENDERERS)
+            prompt = render_public_draft(
                 subreddit=lead.subreddit,
                 title=lead.title,
-                body=lead.body[:1000],
-                category=lead.category or "General Learning",
-            ).replace(
-                "there's also kaiwa (trykaiwa) if you want something more structured",
-                mention_template
+                body=truncate_to_tokens(lead.body, MAX_BODY_TOKENS),
             )
             logger.info(f"Using promotional prompt for {lead.post_id} (mention allowed)")
         else:
             # Use value-only prompt (no product mentions)
-            prompt = VALUE_ONLY_PROMPT.format(
+            prompt = render_value_only(
                 subreddit=lead.subreddit,
                 title=lead.title,
-                body=lead.body[:1000],
+                body=truncate_to_tokens(lead.body, MAX_BODY_TOKENS),
             )
             logger.info(f"Using value-only prompt for {lead.post_id} (pure credibility building)")
 
-        # Use response_model for better quality output
-        draft = self.client.generate(prompt, max_tokens=500, model=self.response_model)
-        return draft, include_kaiwa
+        return prompt, include_kaiwa
 
     def generate_dm_draft(self, lead: Lead) -> Optional[str]:
         """
@@ -256,21 +467,25 @@ class ResponseGenerator:
         if not self.client.is_configured():
             return None
 
-        prompt = DM_DRAFT_PROMPT.format(
+        # Use response_model for better quality output
+        dm = "".join(self.client.generate_stream(self._dm_draft_prompt(lead), max_tokens=200, model=self.response_model))
+        return dm or None
+
+    def _dm_draft_prompt(self, lead: Lead) -> str:
+        """Build the DM prompt for a lead."""
+        return render_dm_draft(
             title=lead.title,
             category=lead.category or "language learning challenges",
             language=lead.language_detected or "a new language",
         )
 
-        # Use response_model for better quality output
-        return self.client.generate(prompt, max_tokens=200, model=self.response_model)
-
     def generate_responses(self, lead: Lead) -> Lead:
         """
         Generate both public and DM drafts for a lead.
 
         First evaluates if the lead is worth commenting on (if enabled),
-        then generates responses only for worthy leads.
+        then generates responses only for worthy leads. The public and DM
+        drafts are generated concurrently.
 
         Args:
             lead: Lead to generate responses for
@@ -296,18 +511,146 @@ class ResponseGenerator:
 
         # Generate responses only for worthy leads
         logger.info(f"Generating responses for lead {lead.post_id} using {self.response_model}...")
-        draft, kaiwa_mentioned = self.generate_public_draft(lead)
-        lead.public_draft = draft
-        lead.kaiwa_mention_allowed = kaiwa_mentioned
-        lead.dm_draft = self.generate_dm_draft(lead)
+
+        # The two drafts are independent, so run them side by side
+        self.client.map_concurrent(lambda job: job(lead), [self._public_job, self._dm_job])
 
         return lead
 
+    def analyze_lead(self, lead: Lead) -> dict:
+        """
+        Score, evaluate and draft responses for a lead in a single API call.
+
+        Populates signal_score, signal_type, category, comment_worthy,
+        comment_worthy_reason, public_draft, dm_draft and
+        kaiwa_mention_allowed. Falls back to the separate scoring and
+        generation calls if the fused response can't be parsed.
+
+        Args:
+            lead: Lead to analyze
+
+        Returns:
+            Parsed analysis dict (empty if the fallback path was used)
+        """
+        if not self.client.is_configured():
+            return {}
+
+        include_kaiwa = random.random() < gemini_config.kaiwa_mention_probability
+        if include_kaiwa:
+            mention_rule = FUSED_MENTION_RULE.format(template=random.choice(KAIWA_MENTION_TEMPLATES))
+        else:
+            mention_rule = FUSED_NO_MENTION_RULE
+
+        prompt = render_fused_analysis(
+            threshold=gemini_config.signal_threshold,
+            mention_rule=mention_rule,
+            subreddit=lead.subreddit,
+            title=lead.title,
+            body=truncate_to_tokens(lead.body, MAX_BODY_TOKENS),
+            triggers=lead.triggers_csv,
+            language=lead.language_detected or "unknown",
+        )
+
+        response = self.client.generate_json(
+            prompt, max_tokens=800, model=self.response_model, schema=FUSED_ANALYSIS_SCHEMA
+        )
+
+        try:
+            result = parse_json(response) if response else None
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse fused analysis for {lead.post_id}: {e}")
+            result = None
+
+        if not isinstance(result, dict) or "score" not in result:
+            logger.warning(f"Fused analysis failed for {lead.post_id}, falling back to separate calls")
+            SignalScorer(client=self.client).score_lead(lead)
+            if lead.signal_score is not None and lead.signal_score >= gemini_config.signal_threshold:
+                self.generate_responses(lead)
+            return {}
+
+        lead.signal_score = parse_score(result.get("score"))
+        lead.signal_type = result.get("signal_type", "MEDIUM")
+        lead.category = result.get("category", "General Learning")
+        logger.info(
+            f"Scored lead {lead.post_id}: {lead.signal_score}/10 ({lead.signal_type}) - {lead.category}"
+        )
+
+        if lead.signal_score >= gemini_config.signal_threshold:
+            if self.require_comment_worthy:
+                lead.comment_worthy = result.get("worthy", True)
+                lead.comment_worthy_reason = result.get("reason", "No reason provided")
+                logger.info(
+                    f"Comment worthy evaluation for {lead.post_id}: {lead.comment_worthy} - {lead.comment_worthy_reason}"
+                )
+
+            if lead.comment_worthy is not False:
+                lead.public_draft = result.get("public_draft") or None
+                lead.dm_draft = result.get("dm_draft") or None
+                lead.kaiwa_mention_allowed = include_kaiwa
+
+        return result
+
+    def analyze_leads(self, leads: list[Lead]) -> tuple[list[Lead], int]:
+        """
+        Run analyze_lead over many leads concurrently.
+
+        Args:
+            leads: List of leads
+
+        Returns:
+            Tuple of (analyzed leads, count of high-signal leads skipped as not comment-worthy)
+        """
+        if not self.client.is_configured():
+            logger.warning("Gemini not configured - returning leads unanalyzed")
+            return leads, 0
+
+        logger.info(f"Running fused analysis for {len(leads)} leads...")
+        self.client.map_concurrent(self.analyze_lead, leads)
+
+        skipped_count = sum(
+            1 for lead in leads
+            if lead.comment_worthy is False
+            and lead.signal_score is not None
+            and lead.signal_score >= gemini_config.signal_threshold
+        )
+        return leads, skipped_count
+
+    def _generate_drafts_batch_job(self, leads: list[Lead]):
+        """
+        Generate public and DM drafts for many leads in one Batch API job.
+
+        Leads whose drafts come back empty are left for the realtime path.
+        """
+        logger.info(f"Using Gemini Batch API for {len(leads)} leads (>= {gemini_config.batch_threshold})")
+        public_prompts = [self._public_draft_prompt(lead) for lead in leads]
+        jobs = [(prompt, 500) for prompt, _ in public_prompts]
+        jobs += [(self._dm_draft_prompt(lead), 200) for lead in leads]
+
+        results = self.client.generate_batch_job(jobs, model=self.response_model)
+        for i, lead in enumerate(leads):
+            if results[i]:
+                lead.public_draft = results[i]
+                lead.kaiwa_mention_allowed = public_prompts[i][1]
+            if results[len(leads) + i]:
+                lead.dm_draft = results[len(leads) + i]
+
+    def _public_job(self, lead: Lead):
+        """Generate and store the public draft for a lead."""
+        lead.public_draft, lead.kaiwa_mention_allowed = self.generate_public_draft(lead)
+
+    def _dm_job(self, lead: Lead):
+        """Generate and store the DM draft for a lead."""
+        lead.dm_draft = self.generate_dm_draft(lead)
+
     def generate_responses_batch(self, leads: list[Lead]) -> tuple[list[Lead], int]:
         """
         Generate responses for multiple leads.
 
         Evaluates comment worthiness and only generates for worthy leads.
+        Worthiness checks for all leads run concurrently, then every public
+        and DM draft runs concurrently, bounded by the client's concurrency.
+        Leads with identical content (see content_hash) share one result,
+        which is also cached for later runs.
 
         Args:
             leads: List of leads
@@ -319,16 +662,101 @@ class ResponseGenerator:
             logger.warning("Gemini not configured - returning leads without responses")
             return leads, 0
 
-        skipped_count = 0
-        for i, lead in enumerate(leads):
-            logger.info(f"Processing lead {i + 1}/{len(leads)}...")
-            self.generate_responses(lead)
+        with self._skips_lock:
+            self.heuristic_skips = 0
+
+        # Bound once; the loops below run per lead
+        cached_responses = self._cached_responses
+        local_worthiness = self._local_worthiness
+        comment_worthy_prompt = self._comment_worthy_prompt
+        parse_comment_worthy = self._parse_comment_worthy
+
+        # Exact duplicates (cross-posts, rescrapes) are answered once, and
+        # content already answered on an earlier run isn't sent again
+        originals: dict[str, Lead] = {}
+        duplicates: list[tuple[Lead, Lead]] = []
+        pending: list[tuple[str, Lead]] = []
+        cache_hits = 0
+        for lead in leads:
+            digest = content_hash(lead)
+            if digest in originals:
+                duplicates.append((lead, originals[digest]))
+                continue
+            originals[digest] = lead
+
+            cached = cached_responses(digest)
+            if cached:
+                for name, value in cached.items():
+                    setattr(lead, name, value)
+                cache_hits += 1
+            else:
+                pending.append((digest, lead))
+
+        # Send same-subreddit leads back to back so consecutive prompts share
+        # the longest possible prefix (helps Gemini's implicit cache)
+        unique_leads = sorted((lead for _, lead in pending), key=lambda lead: lead.subreddit)
+        worthy_leads = unique_leads
+
+        # Evaluate comment worthiness first (if enabled)
+        if self.require_comment_worthy:
+            logger.info(f"Evaluating comment-worthiness for {len(unique_leads)} leads...")
+            verdicts = {
+                lead.post_id: local_worthiness(lead)
+                for lead in unique_leads
+            }
+            to_evaluate = [lead for lead in unique_leads if not verdicts[lead.post_id]]
+            responses = self.client.generate_batch(
+                [comment_worthy_prompt(lead) for lead in to_evaluate],
+                max_tokens=200,
+                temperature=0.3,
+                json_mode=True,
+                schema=COMMENT_WORTHY_SCHEMA,
+            )
+            for lead, response in zip(to_evaluate, responses):
+                verdicts[lead.post_id] = parse_comment_worthy(lead, response)
+
+            worthy_leads = []
+            for lead in unique_leads:
+                worthy, reason = verdicts[lead.post_id]
+                lead.comment_worthy = worthy
+                lead.comment_worthy_reason = reason
+
+                if worthy:
+                    worthy_leads.append(lead)
+                else:
+                    logger.info(f"Skipping lead {lead.post_id} - not worth commenting: {reason}")
+
+        # Generate responses only for worthy leads
+        if worthy_leads:
+            logger.info(f"Generating responses for {len(worthy_leads)} leads using {self.response_model}...")
+
+            batch_threshold = gemini_config.batch_threshold
+            if batch_threshold and len(worthy_leads) >= batch_threshold:
+                self._generate_drafts_batch_job(worthy_leads)
+
+            # Public and DM drafts don't depend on each other, so all of them
+            # go out together instead of as two back-to-back batches
+            public_job, dm_job = self._public_job, self._dm_job
+            jobs = [(public_job, lead) for lead in worthy_leads if lead.public_draft is None]
+            jobs += [(dm_job, lead) for lead in worthy_leads if lead.dm_draft is None]
+            self.client.map_concurrent(lambda job: job[0](job[1]), jobs)
+
+        for digest, lead in pending:
+            self._cache_responses(digest, lead)
 
-            if lead.comment_worthy is False:
-                skipped_count += 1
+        for lead, original in duplicates:
+            for name in RESPONSE_FIELDS:
+                setattr(lead, name, getattr(original, name))
 
+        skipped_count = sum(1 for lead in leads if lead.comment_worthy is False)
         worthy_count = len(leads) - skipped_count
         logger.info(f"Generated responses for {worthy_count} leads, skipped {skipped_count} as not comment-worthy")
+        if self.heuristic_skips:
+            logger.info(f"{self.heuristic_skips} leads ruled out by heuristics without an API call")
+        if duplicates:
+            logger.info(f"{len(duplicates)} leads reused responses for identical content")
+        if cache_hits:
+            logger.info(f"{cache_hits} leads reused responses cached on an earlier run")
 
         return leads, skipped_count
 
@@ -2,27 +2,32 @@
 Signal scoring for Reddit leads using Gemini.
 """
 
+import hashlib
 import json
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from src.analyzer.gemini_client import GeminiClient
+from src.analyzer.gemini_client import GeminiClient, dump_json, get_gemini_client, parse_json, salvage_json
+from src.analyzer.prompt_template import compile_template
+from src.analyzer.tokens import (
+    MAX_BATCH_BODY_TOKENS,
+    MAX_BODY_TOKENS,
+    MAX_SCORING_BODY_TOKENS,
+    compact_whitespace,
+    truncate_to_tokens,
+)
 from src.config.settings import gemini_config
 from src.storage.models import Lead
 
 logger = logging.getLogger(__name__)
 
+# Static instructions first, lead details last (see prompt_template)
+
 # Scoring prompt template for single lead
 SCORING_PROMPT = """You are analyzing a Reddit post to determine if this person is a good lead for Kaiwa, a language learning app that helps people practice speaking with AI tutors.
 
-Analyze the following post and rate it as a potential lead.
-
-POST DETAILS:
-- Subreddit: r/{subreddit}
-- Title: {title}
-- Body: {body}
-- Matched keywords: {triggers}
+Analyze the post at the end and rate it as a potential lead.
 
 SCORING CRITERIA (with adjustments for urgency and willingness to pay):
 - BASE SCORE: Start with psychological need assessment
@@ -46,6 +51,12 @@ CATEGORIES (pick the most relevant):
 
 Respond with ONLY a JSON object in this exact format:
 {{"score": <1-10>, "signal_type": "<HIGH|MEDIUM|LOW>", "category": "<category>", "reasoning": "<brief explanation>"}}
+
+POST DETAILS:
+- Subreddit: r/{subreddit}
+- Title: {title}
+- Body: {body}
+- Matched keywords: {triggers}
 """
 
 # Batch scoring prompt for multiple leads
@@ -66,13 +77,68 @@ SCORES:
 
 CATEGORIES: "Speaking Anxiety", "Practice Gap", "Immersion Prep", "Plateau Frustration", "App Fatigue", "General Learning"
 
-POSTS TO ANALYZE:
-{posts_json}
-
 Respond with ONLY a JSON array containing one object per post, in the same order:
 [{{"id": "<post_id>", "score": <1-10>, "signal_type": "<HIGH|MEDIUM|LOW>", "category": "<category>", "reasoning": "<brief explanation>"}}, ...]
+
+POSTS TO ANALYZE:
+{posts_json}
 """
 
+# Templates compiled once at import (str.format re-parses on every call)
+render_scoring = compile_template(SCORING_PROMPT)
+render_batch_scoring = compile_template(BATCH_SCORING_PROMPT)
+
+# Structured-output schemas (Gemini models only; Gemma falls back to JSON extraction)
+_SCORING_PROPERTIES = {
+    "score": {"type": "INTEGER"},
+    "signal_type": {"type": "STRING", "enum": ["HIGH", "MEDIUM", "LOW"]},
+    "category": {"type": "STRING"},
+    "reasoning": {"type": "STRING"},
+}
+
+SCORING_SCHEMA = {
+    "type": "OBJECT",
+    "properties": _SCORING_PROPERTIES,
+    "required": ["score", "signal_type", "category", "reasoning"],
+}
+
+BATCH_SCORING_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {"id": {"type": "STRING"}, **_SCORING_PROPERTIES},
+        "required": ["id", "score", "signal_type", "category", "reasoning"],
+    },
+}
+
+
+def parse_score(value, default: int = 5) -> int:
+    """Coerce a model-returned score to an int in 1-10 (default if it isn't a number)."""
+    try:
+        score = int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return default
+    return min(10, max(1, score))
+
+
+# Cached scores are only reused while the prompts that produced them are unchanged
+_SCORING_PROMPTS_HASH = hashlib.sha256(
+    (SCORING_PROMPT + BATCH_SCORING_PROMPT + json.dumps(BATCH_SCORING_SCHEMA, sort_keys=True)).encode("utf-8")
+).hexdigest()
+
+
+def score_cache_key(lead: Lead, model: str) -> str:
+    """Cache key for a lead's score: hash of the model, prompts and content the score depends on."""
+    raw = "|".join((
+        model,
+        _SCORING_PROMPTS_HASH,
+        lead.subreddit,
+        lead.title,
+        truncate_to_tokens(lead.body, MAX_BODY_TOKENS),
+        ",".join(sorted(lead.matched_triggers)),
+    ))
+    return "score:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
 
 class SignalScorer:
     """Score leads based on signal strength using Gemini."""
@@ -85,7 +151,7 @@ class SignalScorer:
             client: Gemini client (default: global client)
             batch_size: Number of leads to process in a single API call
         """
-        self.client = client or GeminiClient()
+        self.client = client or get_gemini_client()
         self.threshold = gemini_config.signal_threshold
         self.batch_size = batch_size
 
@@ -103,35 +169,64 @@ class SignalScorer:
             logger.debug("Gemini not configured - skipping scoring")
             return lead
 
-        prompt = SCORING_PROMPT.format(
+        if self._apply_cached_score(lead):
+            return lead
+
+        return self._request_score(lead)
+
+    def _request_score(self, lead: Lead) -> Lead:
+        """Score a single lead via the API (its cache entry was already checked)."""
+        prompt = render_scoring(
             subreddit=lead.subreddit,
             title=lead.title,
-            body=lead.body[:1000],  # Truncate long posts
+            body=truncate_to_tokens(compact_whitespace(lead.body), MAX_SCORING_BODY_TOKENS),
             triggers=", ".join(lead.matched_triggers),
         )
 
         try:
-            response = self.client.generate_json(prompt)
+            response = self.client.generate_json(prompt, schema=SCORING_SCHEMA)
             if not response:
                 return lead
 
-            result = json.loads(response)
+            result = parse_json(response)
 
-            lead.signal_score = result.get("score", 5)
+            lead.signal_score = parse_score(result.get("score"))
             lead.signal_type = result.get("signal_type", "MEDIUM")
             lead.category = result.get("category", "General Learning")
 
             logger.info(
-                f"Scored lead {lead.post_id}: {lead.signal_score}/10 ({lead.signal_type}) - {lead.category}"
+                "Scored lead %s: %s/10 (%s) - %s",
+                lead.post_id, lead.signal_score, lead.signal_type, lead.category,
             )
+            self._cache_score(lead)
 
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse scoring response: {e}")
+            logger.warning("Failed to parse scoring response: %s", e)
         except Exception as e:
-            logger.error(f"Error scoring lead: {e}")
+            logger.error("Error scoring lead: %s", e)
 
         return lead
 
+    def _apply_cached_score(self, lead: Lead) -> bool:
+        """Fill in a lead's score from the cache. Returns True on a hit."""
+        if not self.client.cache:
+            return False
+
+        cached = self.client.cache.get(score_cache_key(lead, self.client.model_name))
+        if not cached:
+            return False
+
+        lead.signal_score, lead.signal_type, lead.category = parse_json(cached)
+        logger.debug("Scored lead %s from cache: %s/10", lead.post_id, lead.signal_score)
+        return True
+
+    def _cache_score(self, lead: Lead):
+        """Store a lead's score so the same content isn't scored again."""
+        if self.client.cache:
+            self.client.cache.set(
+                score_cache_key(lead, self.client.model_name), json.dumps([lead.signal_score, lead.signal_type, lead.category])
+            )
+
     def _score_batch(self, leads: list[Lead]) -> list[Lead]:
         """
         Score a batch of leads in a single API call.
@@ -152,41 +247,63 @@ class SignalScorer:
                 "id": lead.post_id,
                 "subreddit": lead.subreddit,
                 "title": lead.title,
-                "body": lead.body[:500],  # Shorter for batch
-                "triggers": ", ".join(lead.matched_triggers[:5]),
+                "body": truncate_to_tokens(compact_whitespace(lead.body), MAX_BATCH_BODY_TOKENS),  # Shorter for batch
+                "triggers": lead.triggers_csv,
             })
 
-        prompt = BATCH_SCORING_PROMPT.format(posts_json=json.dumps(posts_data, indent=2))
+        # Compact and unescaped: indentation and \uXXXX escapes only add prompt tokens
+        prompt = render_batch_scoring(posts_json=dump_json(posts_data))
 
         try:
-            response = self.client.generate_json(prompt, max_tokens=2000)
+            response = self.client.generate_json(prompt, max_tokens=2000, schema=BATCH_SCORING_SCHEMA)
             if not response:
-                # Fallback to individual scoring
+                # Fallback to individual scoring (concurrently)
                 logger.warning("Batch scoring failed, falling back to individual scoring")
-                return [self.score_lead(lead) for lead in leads]
-
-            results = json.loads(response)
-
-            # Create a map of results by post_id
-            results_map = {r.get("id"): r for r in results}
+                return self.client.map_concurrent(self._request_score, leads)
+
+            # Salvage the array even if the model added prose or fences around it
+            results = salvage_json(response)
+            if isinstance(results, dict):
+                results = next((v for v in results.values() if isinstance(v, list)), None)
+            if not isinstance(results, list):
+                logger.warning("Batch response isn't a list, falling back to individual scoring")
+                return self.client.map_concurrent(self._request_score, leads)
+
+            # The prompt asks for results in input order; only build an id map if it wasn't kept
+            if len(results) == len(leads) and all(
+                isinstance(r, dict) and r.get("id") == lead.post_id for r, lead in zip(results, leads)
+            ):
+                pairs = zip(leads, results)
+            else:
+                results_map = {r.get("id"): r for r in results if isinstance(r, dict)}
+                pairs = ((lead, results_map.get(lead.post_id)) for lead in leads)
 
             # Update leads with scores
-            for lead in leads:
-                if lead.post_id in results_map:
-                    result = results_map[lead.post_id]
-                    lead.signal_score = result.get("score", 5)
+            missing = []
+            for lead, result in pairs:
+                if result is None:
+                    missing.append(lead)
+                else:
+                    lead.signal_score = parse_score(result.get("score"))
                     lead.signal_type = result.get("signal_type", "MEDIUM")
                     lead.category = result.get("category", "General Learning")
                     logger.info(
-                        f"Scored lead {lead.post_id}: {lead.signal_score}/10 ({lead.signal_type}) - {lead.category}"
+                        "Scored lead %s: %s/10 (%s) - %s",
+                        lead.post_id, lead.signal_score, lead.signal_type, lead.category,
                     )
+                    self._cache_score(lead)
+
+            # Only re-score the leads the model dropped, not the whole batch
+            if missing:
+                logger.warning("Batch response missed %d leads, scoring them individually", len(missing))
+                self.client.map_concurrent(self._request_score, missing)
 
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse batch response: {e}, falling back to individual")
-            return [self.score_lead(lead) for lead in leads]
+            logger.warning("Failed to parse batch response: %s, falling back to individual", e)
+            return self.client.map_concurrent(self._request_score, leads)
         except Exception as e:
-            logger.error(f"Error in batch scoring: {e}, falling back to individual")
-            return [self.score_lead(lead) for lead in leads]
+            logger.error("Error in batch scoring: %s, falling back to individual", e)
+            return self.client.map_concurrent(self._request_score, leads)
 
         return leads
 
@@ -194,6 +311,10 @@ class SignalScorer:
         """
         Score multiple leads, optionally using batch processing.
 
+        Batches (or single leads) run concurrently up to the client's
+        concurrency setting.
+        Leads whose content was already scored come from the response cache.
+
         Args:
             leads: List of leads to score
             use_batch: Whether to use batch processing (default: True)
@@ -208,31 +329,52 @@ class SignalScorer:
         if not leads:
             return leads
 
+        # Leads whose content was scored before (any run, any batch) skip the API
+        pending = [lead for lead in leads if not self._apply_cached_score(lead)]
+        if len(pending) < len(leads):
+            logger.info("%d leads scored from cache", len(leads) - len(pending))
+        if pending:
+            self._score_uncached(pending, use_batch)
+
+        return leads
+
+    def _score_uncached(self, leads: list[Lead], use_batch: bool) -> list[Lead]:
+        """Score leads via the API, in batches or one at a time."""
+        workers = self.client.concurrency
+
         if use_batch and len(leads) > 1:
-            logger.info(f"Batch scoring {len(leads)} leads (batch_size={self.batch_size})...")
+            batches = [leads[i:i + self.batch_size] for i in range(0, len(leads), self.batch_size)]
+            total_batches = len(batches)
+            logger.info("Batch scoring %d leads (batch_size=%d)...", len(leads), self.batch_size)
+
+            if workers > 1 and total_batches > 1:
+                # Batches are independent API calls, so overlap them
+                workers = min(workers, total_batches)
+                logger.info("Processing %d batches with %d workers...", total_batches, workers)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(self._score_batch, batches))
+                return [lead for batch in results for lead in batch]
+
             scored = []
 
             # Process in batches
-            for i in range(0, len(leads), self.batch_size):
-                batch = leads[i:i + self.batch_size]
-                batch_num = i // self.batch_size + 1
-                total_batches = (len(leads) + self.batch_size - 1) // self.batch_size
-
-                logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} leads)...")
+            for batch_num, batch in enumerate(batches, 1):
+                logger.info("Processing batch %d/%d (%d leads)...", batch_num, total_batches, len(batch))
                 scored_batch = self._score_batch(batch)
                 scored.extend(scored_batch)
 
-                # Small delay between batches to avoid rate limiting
-                if i + self.batch_size < len(leads):
-                    time.sleep(0.5)
-
             return scored
         else:
             # Individual scoring
+            if workers > 1 and len(leads) > 1:
+                logger.info("Scoring %d leads with %d workers...", len(leads), min(workers, len(leads)))
+                with ThreadPoolExecutor(max_workers=min(workers, len(leads))) as executor:
+                    return list(executor.map(self._request_score, leads))
+
             scored = []
             for i, lead in enumerate(leads):
-                logger.info(f"Scoring lead {i + 1}/{len(leads)}...")
-                scored_lead = self.score_lead(lead)
+                logger.info("Scoring lead %d/%d...", i + 1, len(leads))
+                scored_lead = self._request_score(lead)
                 scored.append(scored_lead)
             return scored
 
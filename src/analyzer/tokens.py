@@ -0,0 +1,78 @@
+"""
+Token-budget helpers for prompt text.
+
+Gemini bills and prefills by tokens, not characters. English averages about
+four characters per token, but CJK text (Japanese, Chinese, Korean) is
+closer to one token per character, so a fixed character cut lets those
+posts cost several times more. No Gemini tokenizer is available offline,
+so these helpers use that per-script estimate.
+"""
+
+import re
+
+# Average characters per token for Latin-script text
+CHARS_PER_TOKEN = 4
+
+# Token budgets for post bodies in prompts (scoring only needs the gist)
+MAX_BODY_TOKENS = 250
+MAX_SCORING_BODY_TOKENS = 150
+MAX_BATCH_BODY_TOKENS = 75
+
+# CJK punctuation, kana, ideographs, Hangul and full-width forms (~1 token per character)
+_WIDE_RE = re.compile("[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# How far back to look for a space so Latin text isn't cut mid-word
+_WORD_BOUNDARY_WINDOW = 20
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate how many tokens Gemini will count for text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    wide = len(_WIDE_RE.findall(text))
+    return wide + -(-(len(text) - wide) // CHARS_PER_TOKEN)
+
+
+def compact_whitespace(text: str) -> str:
+    """Collapse runs of whitespace (blank lines, indentation) into single spaces."""
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to roughly max_tokens tokens.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+
+    Returns:
+        The longest prefix of text that fits the budget
+    """
+    # Every character costs at most one token
+    if len(text) <= max_tokens or estimate_tokens(text) <= max_tokens:
+        return text
+
+    if not _WIDE_RE.search(text):
+        cut = max_tokens * CHARS_PER_TOKEN
+    else:
+        # Budget in characters of Latin text; wide characters cost a full token
+        budget = max_tokens * CHARS_PER_TOKEN
+        for cut, char in enumerate(text):
+            budget -= CHARS_PER_TOKEN if _WIDE_RE.match(char) else 1
+            if budget < 0:
+                break
+
+    if not text[cut].isspace():
+        space = text.rfind(" ", cut - _WORD_BOUNDARY_WINDOW, cut)
+        if space > 0:
+            cut = space
+    return text[:cut]
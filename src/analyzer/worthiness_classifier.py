@@ -0,0 +1,148 @@
+"""
+Local comment-worthiness classifier.
+
+Worthiness is a yes/no call on short text, which a small distilled model
+(e.g. a fine-tuned MiniLM exported to ONNX and quantized to int8) answers
+in milliseconds on CPU. When WORTHY_CLASSIFIER_PATH points at such a model,
+ResponseGenerator asks it first and only calls Gemini when it isn't
+confident.
+
+Training data comes from Gemini itself: with COLLECT_WORTHY_LABELS=true,
+every Gemini verdict is appended to data/worthiness_labels.jsonl.
+
+Expected model layout:
+    <WORTHY_CLASSIFIER_PATH>            ONNX model, logits [not worthy, worthy]
+    <same directory>/tokenizer.json     Hugging Face tokenizers file
+
+Requires: pip install onnxruntime tokenizers numpy
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+from src.config.settings import app_config, gemini_config
+
+logger = logging.getLogger(__name__)
+
+# Check for optional dependencies
+try:
+    import numpy as np
+    import onnxruntime
+    from tokenizers import Tokenizer
+    HAS_ONNX = True
+except ImportError:
+    HAS_ONNX = False
+
+# Where Gemini verdicts are logged for training
+LABELS_PATH = app_config.data_dir / "worthiness_labels.jsonl"
+
+# Longest input the classifier sees (in model tokens)
+MAX_INPUT_TOKENS = 256
+
+
+class WorthinessClassifier:
+    """ONNX sequence classifier for comment-worthiness."""
+
+    def __init__(self, model_path: Path, threshold: Optional[float] = None):
+        """
+        Load the model and its tokenizer.
+
+        Args:
+            model_path: Path to the ONNX model
+            threshold: Minimum confidence to trust a prediction (default: from env)
+        """
+        self.threshold = threshold or gemini_config.worthy_classifier_threshold
+
+        self.session = onnxruntime.InferenceSession(str(model_path), providers=["CPUExecutionProvider"])
+        self.input_names = {node.name for node in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(str(model_path.parent / "tokenizer.json"))
+        self.tokenizer.enable_truncation(MAX_INPUT_TOKENS)
+
+    def predict(self, text: str) -> tuple[bool, float]:
+        """
+        Classify a post.
+
+        Args:
+            text: Post title and body
+
+        Returns:
+            Tuple of (is_worthy, confidence)
+        """
+        encoding = self.tokenizer.encode(text)
+        inputs = {
+            "input_ids": np.array([encoding.ids], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask], dtype=np.int64),
+            "token_type_ids": np.array([encoding.type_ids], dtype=np.int64),
+        }
+        inputs = {name: value for name, value in inputs.items() if name in self.input_names}
+
+        logits = self.session.run(None, inputs)[0][0]
+        probs = np.exp(logits - logits.max())
+        probs /= probs.sum()
+
+        worthy = bool(probs.argmax() == 1)
+        return worthy, float(probs.max())
+
+    def classify(self, text: str) -> Optional[tuple[bool, float]]:
+        """
+        Classify a post if the model is confident enough.
+
+        Args:
+            text: Post title and body
+
+        Returns:
+            Tuple of (is_worthy, confidence), or None below the threshold
+        """
+        worthy, confidence = self.predict(text)
+        if confidence < self.threshold:
+            return None
+        return worthy, confidence
+
+
+_labels_lock = threading.Lock()
+
+
+def record_label(text: str, worthy: bool, reason: str):
+    """Append a Gemini verdict to the training labels (if collection is on)."""
+    if not gemini_config.collect_worthy_labels:
+        return
+
+    line = json.dumps({"text": text, "worthy": worthy, "reason": reason}, ensure_ascii=False)
+    with _labels_lock:
+        LABELS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(LABELS_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+# Shared classifier (lazy loaded)
+_classifier = None
+_classifier_loaded = False
+
+
+def get_worthiness_classifier() -> Optional[WorthinessClassifier]:
+    """Get the configured classifier (None if not configured or unavailable)."""
+    global _classifier, _classifier_loaded
+    if _classifier_loaded:
+        return _classifier
+    _classifier_loaded = True
+
+    if not gemini_config.worthy_classifier_path:
+        return None
+
+    if not HAS_ONNX:
+        logger.warning(
+            "WORTHY_CLASSIFIER_PATH is set but onnxruntime/tokenizers aren't installed "
+            "- using Gemini for worthiness. Install with: pip install onnxruntime tokenizers numpy"
+        )
+        return None
+
+    try:
+        _classifier = WorthinessClassifier(Path(gemini_config.worthy_classifier_path))
+        logger.info(f"Loaded worthiness classifier from {gemini_config.worthy_classifier_path}")
+    except Exception as e:
+        logger.warning(f"Failed to load worthiness classifier - using Gemini: {e}")
+    return _classifier
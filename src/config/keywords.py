@@ -5,6 +5,24 @@ HIGH-SIGNAL triggers: Indicate someone who needs conversation practice
 LOW-SIGNAL exclusions: Filter out test-focused, academic, or off-topic posts
 """
 
+import re
+import threading
+from typing import Sequence
+
+# Multi-pattern matchers find every keyword in one pass over the text
+# (optional; hyperscan is preferred, then pyahocorasick)
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 # Supported languages for keyword generation
 SUPPORTED_LANGUAGES = [
     "japanese", "spanish", "french", "german", "italian", "portuguese",
@@ -14,22 +32,23 @@ SUPPORTED_LANGUAGES = [
 
 # High-signal trigger keywords
 # Posts containing these indicate potential leads for conversation practice
-TRIGGER_KEYWORDS: list[str] = [
+# (tuples: built once at import and immutable)
+TRIGGER_KEYWORDS: tuple[str, ...] = (
     # === Language-specific keywords (generated) ===
     # "speak X" pattern
-    *[f"speak {lang}" for lang in SUPPORTED_LANGUAGES],
+    *(f"speak {lang}" for lang in SUPPORTED_LANGUAGES),
     # "learning X" pattern
-    *[f"learning {lang}" for lang in SUPPORTED_LANGUAGES],
+    *(f"learning {lang}" for lang in SUPPORTED_LANGUAGES),
     # "best way to learn X" pattern
-    *[f"best way to learn {lang}" for lang in SUPPORTED_LANGUAGES],
+    *(f"best way to learn {lang}" for lang in SUPPORTED_LANGUAGES),
     # "fluency in X" pattern
-    *[f"fluency in {lang}" for lang in SUPPORTED_LANGUAGES],
+    *(f"fluency in {lang}" for lang in SUPPORTED_LANGUAGES),
     # "practice speaking X" pattern
-    *[f"practice speaking {lang}" for lang in SUPPORTED_LANGUAGES],
+    *(f"practice speaking {lang}" for lang in SUPPORTED_LANGUAGES),
     # "become conversational in X" pattern
-    *[f"become conversational in {lang}" for lang in SUPPORTED_LANGUAGES],
+    *(f"become conversational in {lang}" for lang in SUPPORTED_LANGUAGES),
     # "conversational X" pattern
-    *[f"conversational {lang}" for lang in SUPPORTED_LANGUAGES],
+    *(f"conversational {lang}" for lang in SUPPORTED_LANGUAGES),
 
     # === Speaking anxiety / emotional / PAIN ===
     "afraid to speak",
@@ -166,17 +185,16 @@ TRIGGER_KEYWORDS: list[str] = [
     "paid app",
     "better than duolingo",
     "duolingo alternative",
-    "beyond duolingo",
     "after duolingo",
     "italki alternative",
     "cheaper than italki",
     "invest in",
     "investment in",
-]
+)
 
 # Low-signal exclusion keywords
 # Posts containing these are filtered out (test-focused, academic, off-topic)
-EXCLUDE_KEYWORDS: list[str] = [
+EXCLUDE_KEYWORDS: tuple[str, ...] = (
     # === Language proficiency tests ===
     "jlpt",
     "n1",
@@ -281,7 +299,173 @@ EXCLUDE_KEYWORDS: list[str] = [
     "$0",
     "zero dollars",
     "not spending",
-]
+)
+
+
+class KeywordMatcher:
+    """
+    Find which keywords from a fixed list occur in a text.
+
+    All keywords are compiled once into a multi-pattern matcher and found
+    in a single pass: a hyperscan database (SIMD DFA) if installed, else a
+    pyahocorasick automaton. Without either, each keyword is checked with
+    a substring test.
+
+    By default a keyword is not reported when a longer matched keyword
+    contains it (e.g. "practice speaking" under "practice speaking korean").
+    """
+
+    def __init__(self, keywords: Sequence[str], drop_subsumed: bool = True):
+        """
+        Compile the keyword list.
+
+        Args:
+            keywords: Lowercase keywords (matches are returned in this order)
+            drop_subsumed: Skip keywords contained in another matched keyword
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        self._database = None
+        self._automaton = None
+
+        # For each keyword, the other keywords that contain it
+        self._contained_in = [
+            frozenset(j for j, other in enumerate(self.keywords) if j != i and kw in other)
+            if drop_subsumed else frozenset()
+            for i, kw in enumerate(self.keywords)
+        ]
+
+        if not self.keywords:
+            return
+
+        if HAS_HYPERSCAN:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[re.escape(kw).encode("utf-8") for kw in self.keywords],
+                ids=list(range(len(self.keywords))),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self.keywords),
+            )
+            self._database = database
+            self._scan_lock = threading.Lock()  # One scratch space per database
+        elif HAS_AHOCORASICK:
+            automaton = ahocorasick.Automaton()
+            for i, kw in enumerate(self.keywords):
+                automaton.add_word(kw, i)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find(self, text_lower: str | bytes) -> list[str]:
+        """
+        Return the keywords contained in text_lower, in keyword-list order.
+
+        Args:
+            text_lower: Lowercased text to search (str, or UTF-8 bytes)
+        """
+        return self._report(self.scan(text_lower))
+
+    def scan(self, text_lower: str | bytes) -> set[int]:
+        """
+        Return the indices (into self.keywords) of every keyword in text_lower.
+
+        Args:
+            text_lower: Lowercased text to search (str, or UTF-8 bytes)
+        """
+        if self._database is not None:
+            if isinstance(text_lower, str):
+                text_lower = text_lower.encode("utf-8")
+            found = set()
+
+            def on_match(pattern_id, start, end, flags, context):
+                found.add(pattern_id)
+
+            with self._scan_lock:
+                self._database.scan(text_lower, match_event_handler=on_match)
+            return found
+
+        if isinstance(text_lower, bytes):
+            text_lower = text_lower.decode("utf-8")
+        if self._automaton is not None:
+            return {i for _, i in self._automaton.iter(text_lower)}
+        return {i for i, kw in enumerate(self.keywords) if kw in text_lower}
+
+    def _report(self, found: set[int]) -> list[str]:
+        """Turn matched keyword indices into the reported keyword list."""
+        contained_in = self._contained_in
+        return [self.keywords[i] for i in sorted(found) if not contained_in[i] & found]
+
+
+class KeywordGroupMatcher:
+    """
+    Find keywords from several lists in a single scan of the text.
+
+    All lists share one compiled KeywordMatcher; matches are then reported
+    per list, with subsumed keywords dropped within each list only.
+    """
+
+    def __init__(self, *groups: Sequence[str]):
+        """
+        Compile the keyword lists.
+
+        Args:
+            groups: Lowercase keyword lists (matches are returned per list, in list order)
+        """
+        self.matcher = KeywordMatcher([kw for group in groups for kw in group], drop_subsumed=False)
+        keywords = self.matcher.keywords
+        index = {kw: i for i, kw in enumerate(keywords)}
+        self._group_count = len(groups)
+
+        # For each keyword: (group, position in group, longer keywords of that group containing it)
+        self._memberships = [[] for _ in keywords]
+        for g, group in enumerate(groups):
+            ids = [index[kw] for kw in dict.fromkeys(group)]
+            for position, i in enumerate(ids):
+                contained_in = frozenset(j for j in ids if j != i and keywords[i] in keywords[j])
+                self._memberships[i].append((g, position, contained_in))
+
+    def find(self, text_lower: str | bytes) -> list[list[str]]:
+        """
+        Return the matched keywords of each list.
+
+        Args:
+            text_lower: Lowercased text to search (str, or UTF-8 bytes)
+        """
+        found = self.matcher.scan(text_lower)
+        matches = [[] for _ in range(self._group_count)]
+        if not found:
+            return matches
+
+        memberships = self._memberships
+        for i in found:
+            for g, position, contained_in in memberships[i]:
+                if not contained_in or contained_in.isdisjoint(found):
+                    matches[g].append((position, i))
+
+        keywords = self.matcher.keywords
+        for group in matches:
+            group.sort()
+            group[:] = [keywords[i] for _, i in group]
+        return matches
+
+
+# Compiled once at import; has_*_keyword run for every fetched post
+_TRIGGER_MATCHER = KeywordMatcher(TRIGGER_KEYWORDS)
+_EXCLUDE_MATCHER = KeywordMatcher(EXCLUDE_KEYWORDS)
+
+# classify_text finds both kinds of keyword in one automaton pass. hyperscan
+# scans are dominated by per-match callbacks, so a combined database is no
+# faster there and the two separate databases are kept.
+_CLASSIFY_MATCHER = None if HAS_HYPERSCAN else KeywordGroupMatcher(TRIGGER_KEYWORDS, EXCLUDE_KEYWORDS)
+
+# hyperscan scans bytes, and for ASCII keywords lowercasing the UTF-8 bytes
+# matches the same posts as str.lower() while skipping a Unicode pass
+_MATCH_BYTES = HAS_HYPERSCAN and all(kw.isascii() for kw in TRIGGER_KEYWORDS + EXCLUDE_KEYWORDS)
+
+
+def _lowercase(text: str, lowered: bool = False) -> str | bytes:
+    """Lowercase text (unless already lowered) into the form the keyword matchers scan fastest."""
+    if _MATCH_BYTES:
+        encoded = text.encode("utf-8", "ignore")
+        return encoded if lowered else encoded.lower()
+    return text if lowered else text.lower()
 
 
 def has_trigger_keyword(text: str) -> tuple[bool, list[str]]:
@@ -289,8 +473,7 @@ def has_trigger_keyword(text: str) -> tuple[bool, list[str]]:
     Check if text contains any trigger keywords.
     Returns (has_trigger, list_of_matched_keywords).
     """
-    text_lower = text.lower()
-    matched = [kw for kw in TRIGGER_KEYWORDS if kw in text_lower]
+    matched = _TRIGGER_MATCHER.find(_lowercase(text))
     return len(matched) > 0, matched
 
 
@@ -299,11 +482,32 @@ def has_exclude_keyword(text: str) -> tuple[bool, list[str]]:
     Check if text contains any exclusion keywords.
     Returns (should_exclude, list_of_matched_keywords).
     """
-    text_lower = text.lower()
-    matched = [kw for kw in EXCLUDE_KEYWORDS if kw in text_lower]
+    matched = _EXCLUDE_MATCHER.find(_lowercase(text))
     return len(matched) > 0, matched
 
 
+def classify_text(text: str, stop_on_exclude: bool = False, lowered: bool = False) -> tuple[list[str], list[str]]:
+    """
+    Find trigger and exclusion keywords in one scan, lowercasing text once.
+    Returns (matched_triggers, matched_excludes).
+
+    With stop_on_exclude, triggers are returned empty when any exclusion
+    matches (and with separate matchers the trigger scan is skipped).
+    Pass lowered=True when text is already lowercase to skip that step.
+    """
+    text_lower = _lowercase(text, lowered)
+    if _CLASSIFY_MATCHER is None:
+        excludes = _EXCLUDE_MATCHER.find(text_lower)
+        if stop_on_exclude and excludes:
+            return [], excludes
+        return _TRIGGER_MATCHER.find(text_lower), excludes
+
+    triggers, excludes = _CLASSIFY_MATCHER.find(text_lower)
+    if stop_on_exclude and excludes:
+        return [], excludes
+    return triggers, excludes
+
+
 if __name__ == "__main__":
     print("Keyword Configuration")
     print("=" * 50)
@@ -2,8 +2,11 @@
 Language definitions and associated subreddits.
 """
 
+import functools
 from dataclasses import dataclass
 
+from src.config.keywords import KeywordMatcher
+
 
 @dataclass
 class Language:
@@ -152,8 +155,7 @@ GENERAL_SUBREDDITS = [
 ]
 
 
-def get_all_subreddits() -> list[str]:
-    """Get all subreddits to monitor (includes relocation and cultural subreddits)."""
+def _build_all_subreddits() -> set[str]:
     subreddits = set(GENERAL_SUBREDDITS)
     subreddits.update(RELOCATION_SUBREDDITS)
     subreddits.update(CULTURAL_SUBREDDITS)
@@ -161,31 +163,75 @@ def get_all_subreddits() -> list[str]:
     for code in PRIORITY_LANGUAGES:
         if code in LANGUAGES:
             subreddits.update(LANGUAGES[code].subreddits)
-    return sorted(subreddits)
+    return subreddits
 
 
-def get_language_names() -> list[str]:
-    """Get all language names for keyword matching."""
+# Every monitored subreddit, computed once at import
+ALL_SUBREDDITS_SET: frozenset[str] = frozenset(_build_all_subreddits())
+ALL_SUBREDDITS: tuple[str, ...] = tuple(sorted(ALL_SUBREDDITS_SET))
+
+
+def get_all_subreddits() -> list[str]:
+    """Get all subreddits to monitor (includes relocation and cultural subreddits)."""
+    # Callers get their own copy of the list
+    return list(ALL_SUBREDDITS)
+
+
+@functools.lru_cache(maxsize=1)
+def _language_names() -> tuple[str, ...]:
     names = []
     for lang in LANGUAGES.values():
         names.append(lang.name.lower())
         names.append(lang.native_name.lower())
-    return names
+    return tuple(names)
+
+
+def get_language_names() -> list[str]:
+    """Get all language names for keyword matching."""
+    return list(_language_names())
 
 
-def detect_language(text: str) -> str | None:
+def _build_language_matcher() -> tuple[KeywordMatcher, dict[str, int]]:
+    """Compile priority-language names into one matcher (name -> priority rank)."""
+    ranks = {}
+    for rank, code in enumerate(PRIORITY_LANGUAGES):
+        if code in LANGUAGES:
+            lang = LANGUAGES[code]
+            for name in (lang.name.lower(), lang.native_name.lower()):
+                ranks.setdefault(name, rank)
+    return KeywordMatcher(list(ranks), drop_subsumed=False), ranks
+
+
+# Only priority languages are detected; names are matched in one pass
+_LANGUAGE_MATCHER, _LANGUAGE_RANKS = _build_language_matcher()
+
+
+# Short texts (titles, subreddit names) repeat often, so their results are
+# memoized; long post bodies are rarely seen twice and aren't kept in memory
+DETECT_CACHE_MAX_LENGTH = 300
+
+
+def _detect_language(text_lower: str) -> str | None:
+    names = _LANGUAGE_MATCHER.find(text_lower)
+    if not names:
+        return None
+    return PRIORITY_LANGUAGES[min(_LANGUAGE_RANKS[name] for name in names)]
+
+
+_detect_language_cached = functools.lru_cache(maxsize=4096)(_detect_language)
+
+
+def detect_language(text: str, lowered: bool = False) -> str | None:
     """
     Detect which language is being discussed in the text.
     Returns language code or None (only detects priority languages).
+    If several are mentioned, the highest-priority one wins.
+    Pass lowered=True when text is already lowercase to skip that step.
     """
-    text_lower = text.lower()
-    # Only detect priority languages
-    for code in PRIORITY_LANGUAGES:
-        if code in LANGUAGES:
-            lang = LANGUAGES[code]
-            if lang.name.lower() in text_lower or lang.native_name.lower() in text_lower:
-                return code
-    return None
+    text_lower = text if lowered else text.lower()
+    if len(text_lower) <= DETECT_CACHE_MAX_LENGTH:
+        return _detect_language_cached(text_lower)
+    return _detect_language(text_lower)
 
 
 if __name__ == "__main__":
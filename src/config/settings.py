@@ -2,14 +2,44 @@
 Application settings loaded from environment variables.
 """
 
+import functools
+import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load .env file from project root
+# Load .env file from project root (skipped in deployments that inject env vars)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-load_dotenv(PROJECT_ROOT / ".env")
+_ENV_PATH = PROJECT_ROOT / ".env"
+if os.getenv("KAIWA_SKIP_DOTENV") != "1" and _ENV_PATH.is_file():
+    load_dotenv(_ENV_PATH)
+
+logger = logging.getLogger(__name__)
+
+
+def _int_env(name: str, default: int) -> int:
+    """Read an integer env var, falling back to default (with a warning) if it's malformed."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Invalid {name}={value!r}, using default {default}")
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    """Read a float env var, falling back to default (with a warning) if it's malformed."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Invalid {name}={value!r}, using default {default}")
+        return default
 
 
 @dataclass
@@ -45,6 +75,15 @@ class GeminiConfig:
     signal_threshold: int
     require_comment_worthy: bool  # Whether to evaluate comment-worthiness before generating
     kaiwa_mention_probability: float  # Probability (0.0-1.0) of mentioning Kaiwa in comments
+    concurrency: int  # Max concurrent Gemini requests in batch operations
+    fused_analysis: bool  # Score, evaluate and draft in one call per lead
+    batch_threshold: int  # Use the Batch API for drafts at this many leads (0 = never)
+    batch_timeout_seconds: int  # How long to wait for a batch job before falling back
+    cache_enabled: bool  # Whether to cache Gemini responses on disk
+    cache_ttl_seconds: int  # How long cached responses stay valid
+    worthy_classifier_path: str  # Local ONNX comment-worthiness model (empty = use Gemini)
+    worthy_classifier_threshold: float  # Min classifier confidence before falling back to Gemini
+    collect_worthy_labels: bool  # Log Gemini worthiness verdicts as classifier training data
 
     @classmethod
     def from_env(cls) -> "GeminiConfig":
@@ -52,9 +91,18 @@ class GeminiConfig:
             api_key=os.getenv("GEMINI_API_KEY", ""),
             model=os.getenv("GEMINI_MODEL", "gemma-3-27b-it"),
             response_model=os.getenv("RESPONSE_MODEL", "gemini-2.5-flash-lite"),
-            signal_threshold=int(os.getenv("SIGNAL_THRESHOLD", "8")),
+            signal_threshold=_int_env("SIGNAL_THRESHOLD", 8),
             require_comment_worthy=os.getenv("REQUIRE_COMMENT_WORTHY", "true").lower() == "true",
-            kaiwa_mention_probability=float(os.getenv("KAIWA_MENTION_PROBABILITY", "0.2")),
+            kaiwa_mention_probability=_float_env("KAIWA_MENTION_PROBABILITY", 0.2),
+            concurrency=_int_env("GEMINI_CONCURRENCY", 8),
+            fused_analysis=os.getenv("FUSED_ANALYSIS", "false").lower() == "true",
+            batch_threshold=_int_env("GEMINI_BATCH_THRESHOLD", 0),
+            batch_timeout_seconds=_int_env("GEMINI_BATCH_TIMEOUT", 3600),
+            cache_enabled=os.getenv("GEMINI_CACHE", "true").lower() == "true",
+            cache_ttl_seconds=_int_env("GEMINI_CACHE_TTL", 7 * 24 * 3600),
+            worthy_classifier_path=os.getenv("WORTHY_CLASSIFIER_PATH", ""),
+            worthy_classifier_threshold=_float_env("WORTHY_CLASSIFIER_THRESHOLD", 0.7),
+            collect_worthy_labels=os.getenv("COLLECT_WORTHY_LABELS", "false").lower() == "true",
         )
 
     def is_valid(self) -> bool:
@@ -70,6 +118,11 @@ class SheetsConfig:
     sheet_name: str
     folder_id: str  # Optional Google Drive folder ID
     impersonate_email: str  # Email to impersonate with domain-wide delegation
+    post_id_ttl_seconds: int  # How long a sheet's locally cached post IDs are trusted
+    credentials_path: Path = field(init=False)  # credentials_file resolved against PROJECT_ROOT
+
+    def __post_init__(self):
+        self.credentials_path = PROJECT_ROOT / self.credentials_file
 
     @classmethod
     def from_env(cls) -> "SheetsConfig":
@@ -79,6 +132,7 @@ class SheetsConfig:
             sheet_name=os.getenv("GOOGLE_SHEET_NAME", "Kaiwa Leads Dashboard"),
             folder_id=os.getenv("GOOGLE_FOLDER_ID", ""),
             impersonate_email=os.getenv("GOOGLE_IMPERSONATE_EMAIL", ""),
+            post_id_ttl_seconds=_int_env("GOOGLE_SHEET_IDS_TTL", 6 * 3600),
         )
 
     def has_inline_json(self) -> bool:
@@ -89,12 +143,11 @@ class SheetsConfig:
         """Check if credentials are available (inline JSON or file exists)."""
         if self.has_inline_json():
             return True
-        creds_path = PROJECT_ROOT / self.credentials_file
-        return creds_path.exists()
+        return self.credentials_path.exists()
 
     def get_credentials_path(self) -> Path:
         """Get the path to credentials file."""
-        return PROJECT_ROOT / self.credentials_file
+        return self.credentials_path
 
 
 @dataclass
@@ -108,39 +161,134 @@ class AppConfig:
     def from_env(cls) -> "AppConfig":
         return cls(
             log_level=os.getenv("LOG_LEVEL", "INFO"),
-            max_posts_per_run=int(os.getenv("MAX_POSTS_PER_RUN", "300")),
+            max_posts_per_run=_int_env("MAX_POSTS_PER_RUN", 300),
             data_dir=PROJECT_ROOT / "data",
         )
 
 
-# Global config instances
-reddit_config = RedditConfig.from_env()
-gemini_config = GeminiConfig.from_env()
-sheets_config = SheetsConfig.from_env()
-app_config = AppConfig.from_env()
+# Global config instances (each read from the environment on first use)
+@functools.lru_cache(maxsize=1)
+def get_reddit_config() -> RedditConfig:
+    """Get the shared Reddit configuration."""
+    return RedditConfig.from_env()
+
+
+@functools.lru_cache(maxsize=1)
+def get_gemini_config() -> GeminiConfig:
+    """Get the shared Gemini configuration."""
+    return GeminiConfig.from_env()
+
+
+@functools.lru_cache(maxsize=1)
+def get_sheets_config() -> SheetsConfig:
+    """Get the shared Google Sheets configuration."""
+    return SheetsConfig.from_env()
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_config() -> AppConfig:
+    """Get the shared application configuration."""
+    return AppConfig.from_env()
+
+
+# `from src.config.settings import gemini_config` keeps working: the module
+# attributes are resolved through the accessors on first access (PEP 562)
+_LAZY_CONFIGS = {
+    "reddit_config": get_reddit_config,
+    "gemini_config": get_gemini_config,
+    "sheets_config": get_sheets_config,
+    "app_config": get_app_config,
+}
+
+
+def __getattr__(name):
+    accessor = _LAZY_CONFIGS.get(name)
+    if accessor is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = accessor()
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "PROJECT_ROOT",
+    "RedditConfig",
+    "GeminiConfig",
+    "SheetsConfig",
+    "AppConfig",
+    "get_reddit_config",
+    "get_gemini_config",
+    "get_sheets_config",
+    "get_app_config",
+    *_LAZY_CONFIGS,
+    "print_config_status",
+]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+_STATUS_RULE = "=" * 50
+
+# Config status report, filled in by print_config_status
+_STATUS_TEMPLATE = f"""{_STATUS_RULE}
+Configuration Status
+{_STATUS_RULE}
+Reddit API configured: {{reddit_ok}}
+  - Client ID: {{client_id}}
+  - Username: {{username}}
+Gemini API configured: {{gemini_ok}}
+  - Scoring model: {{model}}
+  - Response model: {{response_model}}
+  - Signal threshold: {{signal_threshold}}
+  - Require comment-worthy: {{require_comment_worthy}}
+  - Kaiwa mention probability: {{kaiwa_mention_probability:.0%}}
+  - Concurrency: {{concurrency}}
+  - Fused analysis: {{fused_analysis}}
+  - Batch API threshold: {{batch_threshold}}
+  - Response cache: {{cache_enabled}} (TTL {{cache_ttl_seconds}}s)
+  - Worthiness classifier: {{worthy_classifier}}
+Google Sheets configured: {{sheets_ok}}
+  - Credentials: {{credentials}}
+  - Sheet name: {{sheet_name}}
+Log level: {{log_level}}
+Max posts per run: {{max_posts_per_run}}
+Data directory: {{data_dir}}
+{_STATUS_RULE}"""
 
 
 def print_config_status():
     """Print configuration status for debugging."""
-    print("=" * 50)
-    print("Configuration Status")
-    print("=" * 50)
-    print(f"Reddit API configured: {reddit_config.is_valid()}")
-    print(f"  - Client ID: {'***' + reddit_config.client_id[-4:] if len(reddit_config.client_id) > 4 else '(not set)'}")
-    print(f"  - Username: {reddit_config.username or '(not set)'}")
-    print(f"Gemini API configured: {gemini_config.is_valid()}")
-    print(f"  - Scoring model: {gemini_config.model}")
-    print(f"  - Response model: {gemini_config.response_model}")
-    print(f"  - Signal threshold: {gemini_config.signal_threshold}")
-    print(f"  - Require comment-worthy: {gemini_config.require_comment_worthy}")
-    print(f"  - Kaiwa mention probability: {gemini_config.kaiwa_mention_probability:.0%}")
-    print(f"Google Sheets configured: {sheets_config.is_valid()}")
-    print(f"  - Credentials: {'(inline JSON)' if sheets_config.has_inline_json() else sheets_config.credentials_file}")
-    print(f"  - Sheet name: {sheets_config.sheet_name}")
-    print(f"Log level: {app_config.log_level}")
-    print(f"Max posts per run: {app_config.max_posts_per_run}")
-    print(f"Data directory: {app_config.data_dir}")
-    print("=" * 50)
+    reddit_config = get_reddit_config()
+    gemini_config = get_gemini_config()
+    sheets_config = get_sheets_config()
+    app_config = get_app_config()
+
+    print(_STATUS_TEMPLATE.format(
+        reddit_ok=reddit_config.is_valid(),
+        client_id="***" + reddit_config.client_id[-4:] if len(reddit_config.client_id) > 4 else "(not set)",
+        username=reddit_config.username or "(not set)",
+        gemini_ok=gemini_config.is_valid(),
+        model=gemini_config.model,
+        response_model=gemini_config.response_model,
+        signal_threshold=gemini_config.signal_threshold,
+        require_comment_worthy=gemini_config.require_comment_worthy,
+        kaiwa_mention_probability=gemini_config.kaiwa_mention_probability,
+        concurrency=gemini_config.concurrency,
+        fused_analysis=gemini_config.fused_analysis,
+        batch_threshold=gemini_config.batch_threshold or "disabled",
+        cache_enabled=gemini_config.cache_enabled,
+        cache_ttl_seconds=gemini_config.cache_ttl_seconds,
+        worthy_classifier=gemini_config.worthy_classifier_path or "disabled",
+        sheets_ok=sheets_config.is_valid(),
+        credentials="(inline JSON)" if sheets_config.has_inline_json() else sheets_config.credentials_file,
+        sheet_name=sheets_config.sheet_name,
+        log_level=app_config.log_level,
+        max_posts_per_run=app_config.max_posts_per_run,
+        data_dir=app_config.data_dir,
+    ))
 
 
 if __name__ == "__main__":
@@ -8,20 +8,41 @@ Phase 3: Export to Google Sheets with timestamps.
 
 import argparse
 import logging
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from src.config.settings import app_config, gemini_config, sheets_config, print_config_status
-from src.config.languages import get_all_subreddits, LANGUAGES
-from src.scraper.reddit_client import get_reddit_client
-from src.scraper.keyword_filter import KeywordFilter
-from src.storage.csv_storage import CSVStorage
+from src.config.settings import get_app_config, get_gemini_config, get_sheets_config, print_config_status
+
+# Verbose lead listing (one template per lead instead of a print per field)
+_LEAD_FMT = (
+    "\n  [{subreddit}] u/{author}\n"
+    "  Title: {title}...\n"
+    "  Triggers: {triggers}\n"
+    "  Language: {language}{signal}\n"
+    "  Link: {post_url}\n"
+    "  DM: {message_url}"
+)
+_LEAD_SIGNAL_FMT = "\n  Signal: {}/10 ({}) - {}"
+
+# Separator for --subreddits (surrounding whitespace is dropped by the split)
+_CSV_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# LOG_LEVEL names (unknown values fall back to INFO)
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 
 def setup_logging(level: str = "INFO"):
     """Configure logging."""
     logging.basicConfig(
-        level=getattr(logging, level.upper()),
+        level=_LOG_LEVELS.get(level.upper(), logging.INFO),
         format="%(asctime)s | %(levelname)-8s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -34,6 +55,9 @@ def run_scout(
     verbose: bool = False,
     analyze: bool = False,
     use_sheets: bool = False,
+    concurrency: int | None = None,
+    use_cache: bool = True,
+    log_summary: bool = False,
 ) -> dict:
     """
     Run the Reddit scout pipeline.
@@ -45,11 +69,21 @@ def run_scout(
         verbose: Print detailed output
         analyze: Run AI analysis with Gemini (Phase 2)
         use_sheets: Export to Google Sheets (Phase 3)
+        concurrency: Max concurrent Gemini requests (default: from env)
+        use_cache: Use the on-disk Gemini response cache (if enabled in env)
+        log_summary: Log the run summary instead of printing it (for the scheduler's log file)
 
     Returns:
         Dict with run statistics
     """
+    # Lazy imports keep --help/--config/--languages from loading the pipeline
+    from src.config.languages import get_all_subreddits
+    from src.scraper.keyword_filter import KeywordFilter
+    from src.scraper.reddit_client import get_reddit_client
+    from src.storage.csv_storage import CSVStorage
+
     logger = logging.getLogger(__name__)
+    gemini_config = get_gemini_config()
 
     # Use all subreddits if not specified
     if not subreddits:
@@ -63,14 +97,11 @@ def run_scout(
     keyword_filter = KeywordFilter()
     storage = CSVStorage()
 
-    # Fetch posts
-    logger.info("Fetching posts from Reddit...")
-    posts = list(client.get_new_posts(subreddits, limit=limit))
-    logger.info(f"Fetched {len(posts)} posts")
-
-    # Filter posts
-    logger.info("Filtering posts by keywords...")
-    leads = list(keyword_filter.filter_posts(iter(posts)))
+    # Fetch and filter posts in one pass (posts are never held in memory)
+    logger.info("Fetching posts from Reddit and filtering by keywords...")
+    leads = list(keyword_filter.filter_posts(client.get_new_posts(subreddits, limit=limit)))
+    post_count = keyword_filter.stats["total"]
+    logger.info(f"Fetched {post_count} posts")
     logger.info(f"Found {len(leads)} potential leads")
 
     if verbose:
@@ -86,16 +117,29 @@ def run_scout(
             logger.info(f"  Response model: {gemini_config.response_model}")
 
             # Lazy import to avoid loading Gemini when not needed
-            from src.analyzer import SignalScorer, ResponseGenerator
-
-            # Score leads
-            scorer = SignalScorer()
-            leads = scorer.score_leads(leads)
-
-            # Filter high-signal leads for response generation
-            high_signal_leads = scorer.filter_high_signal(leads)
-            high_signal_count = len(high_signal_leads)
-            logger.info(f"Found {high_signal_count} high-signal leads (score >= {gemini_config.signal_threshold})")
+            from src.analyzer import GeminiClient, SignalScorer, ResponseGenerator
+
+            # Share one client so scoring and generation use the same concurrency
+            gemini = GeminiClient(concurrency=concurrency, use_cache=None if use_cache else False)
+            logger.info(f"  Concurrency: {gemini.concurrency}")
+
+            scorer = SignalScorer(client=gemini)
+            generator = ResponseGenerator(client=gemini)
+
+            if gemini_config.fused_analysis:
+                # One call per lead covers scoring, worthiness and drafts
+                leads, skipped_unworthy_count = generator.analyze_leads(leads)
+                high_signal_count = len(scorer.filter_high_signal(leads))
+                logger.info(f"Found {high_signal_count} high-signal leads (score >= {gemini_config.signal_threshold})")
+                high_signal_leads = []
+            else:
+                # Score leads
+                leads = scorer.score_leads(leads)
+
+                # Filter high-signal leads for response generation
+                high_signal_leads = scorer.filter_high_signal(leads)
+                high_signal_count = len(high_signal_leads)
+                logger.info(f"Found {high_signal_count} high-signal leads (score >= {gemini_config.signal_threshold})")
 
             # Generate responses only for high-signal leads
             if high_signal_leads:
@@ -104,85 +148,123 @@ def run_scout(
                 else:
                     logger.info("Generating response drafts for high-signal leads...")
 
-                generator = ResponseGenerator()
                 _, skipped_unworthy_count = generator.generate_responses_batch(high_signal_leads)
 
-                if skipped_unworthy_count > 0:
-                    logger.info(f"Skipped {skipped_unworthy_count} leads as not comment-worthy")
+            if skipped_unworthy_count > 0:
+                logger.info(f"Skipped {skipped_unworthy_count} leads as not comment-worthy")
+
+            usage = gemini.usage
+            logger.info(
+                f"Gemini usage: {usage['requests']} requests, {usage['prompt_tokens']} prompt tokens "
+                f"({usage['cached_tokens']} cached), {usage['output_tokens']} output tokens"
+            )
+            if gemini.limiter.throttle_count:
+                logger.info(
+                    f"Rate limited {gemini.limiter.throttle_count} times; "
+                    f"concurrency settled at {int(gemini.limiter.limit)}"
+                )
+            if gemini.cache:
+                logger.info(f"Response cache: {gemini.cache.hits} hits, {gemini.cache.misses} misses")
         else:
             logger.warning("Gemini API not configured - skipping AI analysis")
             logger.warning("Set GEMINI_API_KEY in .env to enable analysis")
 
-    # Save to CSV (filter by score if analysis was run)
-    if leads:
-        logger.info("Saving leads to CSV...")
-        # Only save high-quality leads (score >= threshold) when analysis is enabled
-        min_score = gemini_config.signal_threshold if analyze else None
-        save_result = storage.save_leads(leads, min_score=min_score)
-        logger.info(f"Saved {save_result['saved']} new leads, skipped {save_result['skipped']} duplicates")
-        if save_result.get('filtered', 0) > 0:
-            logger.info(f"Filtered {save_result['filtered']} leads (score < {min_score})")
-    else:
-        save_result = {"saved": 0, "skipped": 0, "filtered": 0}
-        logger.info("No leads to save")
-
-    # Phase 3: Export to Google Sheets
+    # Save to CSV and export to Sheets concurrently (independent I/O)
+    save_result = {"saved": 0, "skipped": 0, "filtered": 0}
     sheets_result = {"saved": 0, "skipped": 0}
     sheet_url = None
+    export_sheets = False
+
     if use_sheets and leads:
-        if sheets_config.is_valid():
-            logger.info("Exporting to Google Sheets...")
-            from src.output import SheetsClient
-            sheets_client = SheetsClient()
-            sheets_result = sheets_client.append_leads(leads)
-            sheet_url = sheets_client.get_sheet_url()
-            logger.info(f"Added {sheets_result['saved']} leads to sheet, skipped {sheets_result['skipped']} duplicates")
+        if get_sheets_config().is_valid():
+            export_sheets = True
         else:
             logger.warning("Google Sheets not configured - skipping sheet export")
             logger.warning("Add google_creds.json to project root to enable Sheets")
 
-    # Print summary
-    print("\n" + "=" * 60)
-    print("SCOUT RUN COMPLETE")
-    print("=" * 60)
-    print(f"  Time:        {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"  Subreddits:  {len(subreddits)}")
-    print(f"  Posts found: {len(posts)}")
-    print(f"  Leads found: {len(leads)}")
+    def export_to_sheets():
+        logger.info("Exporting to Google Sheets...")
+        from src.output import SheetsClient
+        sheets_client = SheetsClient()
+        result = sheets_client.append_leads(leads)
+        logger.info(f"Added {result['saved']} leads to sheet, skipped {result['skipped']} duplicates")
+        return result, sheets_client.get_sheet_url()
+
+    # Sheets runs on a worker thread while the CSV save runs here
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sheets_future = executor.submit(export_to_sheets) if export_sheets else None
+
+        if leads:
+            logger.info("Saving leads to CSV...")
+            # Only save high-quality leads (score >= threshold) when analysis is enabled
+            min_score = gemini_config.signal_threshold if analyze else None
+            save_result = storage.save_leads(leads, min_score=min_score)
+            logger.info(f"Saved {save_result['saved']} new leads, skipped {save_result['skipped']} duplicates")
+            if save_result.get('filtered', 0) > 0:
+                logger.info(f"Filtered {save_result['filtered']} leads (score < {min_score})")
+        else:
+            logger.info("No leads to save")
+
+        # Phase 3: Export to Google Sheets
+        if sheets_future:
+            sheets_result, sheet_url = sheets_future.result()
+
+    # Print summary (built up and written once)
+    lines = [
+        "\n" + "=" * 60,
+        "SCOUT RUN COMPLETE",
+        "=" * 60,
+        f"  Time:        {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"  Subreddits:  {len(subreddits)}",
+        f"  Posts found: {post_count}",
+        f"  Leads found: {len(leads)}",
+    ]
     if analyze:
-        print(f"  High-signal: {high_signal_count}")
+        lines.append(f"  High-signal: {high_signal_count}")
         if gemini_config.require_comment_worthy:
             comment_worthy_count = high_signal_count - skipped_unworthy_count
-            print(f"  Worth commenting: {comment_worthy_count}")
-            print(f"  Skipped (not worthy): {skipped_unworthy_count}")
-    print(f"  New saved:   {save_result['saved']}")
-    print(f"  Duplicates:  {save_result['skipped']}")
+            lines.append(f"  Worth commenting: {comment_worthy_count}")
+            lines.append(f"  Skipped (not worthy): {skipped_unworthy_count}")
+    lines.append(f"  New saved:   {save_result['saved']}")
+    lines.append(f"  Duplicates:  {save_result['skipped']}")
     if save_result.get('filtered', 0) > 0:
-        print(f"  CSV filtered: {save_result['filtered']} (score < {gemini_config.signal_threshold})")
-    print(f"  CSV file:    {storage.leads_file}")
+        lines.append(f"  CSV filtered: {save_result['filtered']} (score < {gemini_config.signal_threshold})")
+    lines.append(f"  CSV file:    {storage.leads_file}")
     if use_sheets and sheet_url:
-        print(f"  Sheet:       {sheet_url}")
-        print(f"  Sheet saved: {sheets_result['saved']}")
+        lines.append(f"  Sheet:       {sheet_url}")
+        lines.append(f"  Sheet saved: {sheets_result['saved']}")
         if sheets_result.get('filtered', 0) > 0:
-            print(f"  Sheet filtered: {sheets_result['filtered']} (score ≤6 or no comment)")
-    print("=" * 60)
+            lines.append(f"  Sheet filtered: {sheets_result['filtered']} (score ≤6 or no comment)")
+    lines.append("=" * 60)
 
     # Show new leads
     if leads and verbose:
-        print("\nNew Leads:")
-        print("-" * 60)
+        lines.append("\nNew Leads:")
+        lines.append("-" * 60)
+        format_lead = _LEAD_FMT.format
         for lead in leads:
-            print(f"\n  [{lead.subreddit}] u/{lead.author}")
-            print(f"  Title: {lead.title[:60]}...")
-            print(f"  Triggers: {', '.join(lead.matched_triggers[:3])}")
-            print(f"  Language: {lead.language_detected or 'unknown'}")
+            signal = ""
             if analyze and lead.signal_score:
-                print(f"  Signal: {lead.signal_score}/10 ({lead.signal_type}) - {lead.category}")
-            print(f"  Link: {lead.post_url}")
-            print(f"  DM: {lead.message_url}")
+                signal = _LEAD_SIGNAL_FMT.format(lead.signal_score, lead.signal_type, lead.category)
+            lines.append(format_lead(
+                subreddit=lead.subreddit,
+                author=lead.author,
+                title=lead.title[:60],
+                triggers=", ".join(lead.matched_triggers[:3]),
+                language=lead.language_detected or "unknown",
+                signal=signal,
+                post_url=lead.post_url,
+                message_url=lead.message_url,
+            ))
+
+    summary = "\n".join(lines)
+    if log_summary:
+        logger.info(summary)
+    else:
+        print(summary)
 
     return {
-        "posts_fetched": len(posts),
+        "posts_fetched": post_count,
         "leads_found": len(leads),
         "high_signal_leads": high_signal_count,
         "comment_worthy_leads": high_signal_count - skipped_unworthy_count,
@@ -193,6 +275,44 @@ def run_scout(
     }
 
 
+def run(
+    limit: int = 300,
+    analyze: bool = False,
+    sheets: bool = False,
+    verbose: bool = False,
+    concurrency: int | None = None,
+    use_cache: bool = True,
+) -> bool:
+    """
+    Run the scout once in-process (used by the scheduler).
+
+    Args:
+        limit: Maximum posts to fetch
+        analyze: Run AI analysis with Gemini
+        sheets: Export to Google Sheets
+        verbose: Print detailed output
+        concurrency: Max concurrent Gemini requests (default: from env)
+        use_cache: Use the on-disk Gemini response cache
+
+    Returns:
+        True if the run completed, False on error
+    """
+    try:
+        run_scout(
+            limit=limit,
+            verbose=verbose,
+            analyze=analyze,
+            use_sheets=sheets,
+            concurrency=concurrency,
+            use_cache=use_cache,
+            log_summary=True,
+        )
+        return True
+    except Exception as e:
+        logging.getLogger(__name__).exception(f"Scout run failed: {e}")
+        return False
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -235,6 +355,16 @@ def main():
         action="store_true",
         help="Export to Google Sheets (Phase 3)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Max concurrent Gemini requests during analysis (default: GEMINI_CONCURRENCY or 8)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the Gemini response cache",
+    )
     parser.add_argument(
         "--config",
         "-c",
@@ -255,7 +385,7 @@ def main():
     args = parser.parse_args()
 
     # Setup logging
-    setup_logging(app_config.log_level)
+    setup_logging(get_app_config().log_level)
 
     # Handle info commands
     if args.config:
@@ -263,6 +393,7 @@ def main():
         return
 
     if args.languages:
+        from src.config.languages import LANGUAGES
         print("\nSupported Languages:")
         print("-" * 40)
         for code, lang in LANGUAGES.items():
@@ -280,8 +411,8 @@ def main():
 
         # Check Reddit
         print("[1/3] Reddit API...")
-        from src.config.settings import reddit_config
-        if reddit_config.is_valid():
+        from src.config.settings import get_reddit_config
+        if get_reddit_config().is_valid():
             try:
                 from src.scraper.reddit_client import get_reddit_client
                 client = get_reddit_client(use_mock=False)
@@ -296,6 +427,7 @@ def main():
 
         # Check Gemini
         print("[2/3] Gemini API...")
+        gemini_config = get_gemini_config()
         if gemini_config.is_valid():
             try:
                 from src.analyzer.gemini_client import GeminiClient
@@ -314,7 +446,7 @@ def main():
 
         # Check Sheets
         print("[3/3] Google Sheets...")
-        if sheets_config.is_valid():
+        if get_sheets_config().is_valid():
             try:
                 from src.output import SheetsClient
                 client = SheetsClient(auto_date=False)
@@ -341,7 +473,8 @@ def main():
     # Parse subreddits
     subreddits = None
     if args.subreddits:
-        subreddits = [s.strip() for s in args.subreddits.split(",")]
+        # Deduplicated in order so no subreddit is fetched twice
+        subreddits = list(dict.fromkeys(filter(None, _CSV_SPLIT_RE.split(args.subreddits.strip()))))
 
     # Run the scout
     try:
@@ -352,6 +485,8 @@ def main():
             verbose=args.verbose,
             analyze=args.analyze,
             use_sheets=args.sheets,
+            concurrency=args.concurrency,
+            use_cache=not args.no_cache,
         )
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
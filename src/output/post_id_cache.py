@@ -0,0 +1,117 @@
+"""
+Local record of the post IDs already written to each Google Sheet.
+
+Learning which leads a sheet already has means reading its whole Post URL
+column. The answer mostly changes when this app appends, so it is read from
+the sheet and then kept in a local SQLite file, updated on every append and
+re-read once it is older than the TTL (to catch rows removed by hand). The same file remembers each sheet's spreadsheet key, so it can be
+opened directly instead of searched for by name in Google Drive.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.config.settings import app_config, sheets_config
+
+logger = logging.getLogger(__name__)
+
+# Default cache location
+CACHE_PATH = app_config.data_dir / ".sheets_post_ids.sqlite"
+
+
+class PostIdCache:
+    """SQLite-backed set of post IDs per spreadsheet name."""
+
+    def __init__(self, path: Path = CACHE_PATH, ttl_seconds: Optional[int] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path
+            ttl_seconds: How long a sheet's synced IDs stay valid (default: from env)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds or sheets_config.post_id_ttl_seconds
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # A sheet row means its IDs were synced, even if it has none
+        self._conn.execute("CREATE TABLE IF NOT EXISTS sheets (sheet TEXT PRIMARY KEY, synced_at INTEGER)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS post_ids (sheet TEXT, post_id TEXT, PRIMARY KEY (sheet, post_id))"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS spreadsheet_keys (sheet TEXT PRIMARY KEY, key TEXT)")
+        self._conn.commit()
+
+    def load(self, sheet: str) -> Optional[set[str]]:
+        """Return the cached post IDs for a sheet, or None if it was never synced or the sync expired."""
+        with self._lock:
+            row = self._conn.execute("SELECT synced_at FROM sheets WHERE sheet = ?", (sheet,)).fetchone()
+            if not row or time.time() - row[0] >= self.ttl_seconds:
+                return None
+            rows = self._conn.execute("SELECT post_id FROM post_ids WHERE sheet = ?", (sheet,))
+            return {post_id for (post_id,) in rows}
+
+    def replace(self, sheet: str, post_ids: Iterable[str]):
+        """Store the full set of post IDs read from a sheet."""
+        with self._lock:
+            self._conn.execute("DELETE FROM post_ids WHERE sheet = ?", (sheet,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO post_ids (sheet, post_id) VALUES (?, ?)",
+                ((sheet, post_id) for post_id in post_ids),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sheets (sheet, synced_at) VALUES (?, ?)", (sheet, int(time.time()))
+            )
+            self._conn.commit()
+
+    def add(self, sheet: str, post_ids: Iterable[str]):
+        """Record post IDs just appended to a synced sheet."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO post_ids (sheet, post_id) VALUES (?, ?)",
+                ((sheet, post_id) for post_id in post_ids),
+            )
+            self._conn.commit()
+
+    def clear(self, sheet: str):
+        """Forget a sheet (it is re-read from Google Sheets next time)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM post_ids WHERE sheet = ?", (sheet,))
+            self._conn.execute("DELETE FROM sheets WHERE sheet = ?", (sheet,))
+            self._conn.commit()
+
+    def get_key(self, sheet: str) -> Optional[str]:
+        """Return the spreadsheet key recorded for a sheet name, if any."""
+        with self._lock:
+            row = self._conn.execute("SELECT key FROM spreadsheet_keys WHERE sheet = ?", (sheet,)).fetchone()
+            return row[0] if row else None
+
+    def set_key(self, sheet: str, key: Optional[str]):
+        """Record (or, with None, forget) the spreadsheet key for a sheet name."""
+        with self._lock:
+            if key is None:
+                self._conn.execute("DELETE FROM spreadsheet_keys WHERE sheet = ?", (sheet,))
+            else:
+                self._conn.execute("INSERT OR REPLACE INTO spreadsheet_keys (sheet, key) VALUES (?, ?)", (sheet, key))
+            self._conn.commit()
+
+
+# Shared cache instance (lazy loaded)
+_post_id_cache = None
+
+def get_post_id_cache() -> Optional[PostIdCache]:
+    """Get or open the shared post ID cache (None if it can't be opened)."""
+    global _post_id_cache
+    if _post_id_cache is None:
+        try:
+            _post_id_cache = PostIdCache()
+        except sqlite3.Error as e:
+            logger.warning(f"Sheet post ID cache disabled: {e}")
+            return None
+    return _post_id_cache
@@ -4,13 +4,18 @@ Google Sheets client for storing leads.
 
 import json
 import logging
+import re
+import time
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 import gspread
 from google.oauth2.service_account import Credentials
+from gspread.utils import absolute_range_name
 
 from src.config.settings import sheets_config
+from src.output.post_id_cache import PostIdCache, get_post_id_cache
 from src.storage.models import Lead
 
 logger = logging.getLogger(__name__)
@@ -43,6 +48,19 @@ SHEET_HEADERS = [
     "Sent Date",   # When the comment was sent
 ]
 
+# Post URL column (E) without its header, and the post ID inside each URL
+# URL format: https://reddit.com/r/sub/comments/POST_ID/...
+POST_URL_RANGE = "E2:E"
+_POST_ID_RE = re.compile(r"/comments/([^/\s]+)")
+
+# Format of the Timestamp column
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Rows per values.append request, and retries for rate-limited (429/503) requests
+APPEND_CHUNK_ROWS = 500
+APPEND_RETRIES = 5
+RATE_LIMIT_STATUSES = frozenset({429, 503})
+
 # Sheet headers for action tab (streamlined for quick action)
 ACTION_HEADERS = [
     "Post URL",
@@ -56,6 +74,52 @@ ACTION_HEADERS = [
 ]
 
 
+def _header_requests(sheet_id: int, headers: list[str]) -> list[dict]:
+    """
+    Build batchUpdate requests that set up a new sheet's header row.
+
+    Args:
+        sheet_id: Worksheet ID (not the spreadsheet ID)
+        headers: Column names for row 1
+
+    Returns:
+        Requests writing the headers, making them bold and auto-sizing their columns
+    """
+    header_range = {
+        "sheetId": sheet_id,
+        "startRowIndex": 0,
+        "endRowIndex": 1,
+        "startColumnIndex": 0,
+        "endColumnIndex": len(headers),
+    }
+    return [
+        {
+            "updateCells": {
+                "range": header_range,
+                "rows": [{"values": [{"userEnteredValue": {"stringValue": h}} for h in headers]}],
+                "fields": "userEnteredValue",
+            }
+        },
+        {
+            "repeatCell": {
+                "range": header_range,
+                "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
+                "fields": "userEnteredFormat.textFormat.bold",
+            }
+        },
+        {
+            "autoResizeDimensions": {
+                "dimensions": {
+                    "sheetId": sheet_id,
+                    "dimension": "COLUMNS",
+                    "startIndex": 0,
+                    "endIndex": len(headers),
+                }
+            }
+        },
+    ]
+
+
 class SheetsClient:
     """Client for writing leads to Google Sheets."""
 
@@ -74,7 +138,14 @@ class SheetsClient:
         else:
             self.sheet_name = base_name
         self._client = None
+        self._spreadsheet = None
         self._sheet = None
+        self._existing_ids: Optional[set[str]] = None  # Post IDs in the sheet (loaded once)
+
+    @cached_property
+    def _id_cache(self) -> Optional[PostIdCache]:
+        """Post IDs and spreadsheet keys kept across runs, opened on first use."""
+        return get_post_id_cache()
 
     def is_configured(self) -> bool:
         """Check if Sheets is configured."""
@@ -118,7 +189,8 @@ class SheetsClient:
 
         try:
             # Try to open existing spreadsheet
-            self._sheet = client.open(self.sheet_name).sheet1
+            spreadsheet = self._open_spreadsheet(client)
+            self._sheet = spreadsheet.sheet1
             logger.info(f"Opened existing sheet: {self.sheet_name}")
         except gspread.SpreadsheetNotFound:
             # Create new spreadsheet
@@ -131,15 +203,16 @@ class SheetsClient:
                 logger.info(f"Created new sheet: {self.sheet_name}")
 
             self._sheet = spreadsheet.sheet1
+            if self._id_cache:
+                self._id_cache.set_key(self.sheet_name, spreadsheet.id)
 
-            # Add headers
-            self._sheet.append_row(SHEET_HEADERS)
+            # A new sheet has no leads, whatever was recorded under its name
+            self._existing_ids = set()
+            if self._id_cache:
+                self._id_cache.replace(self.sheet_name, ())
 
-            # Format header row (bold)
-            self._sheet.format("A1:R1", {"textFormat": {"bold": True}})
-
-            # Auto-resize columns
-            self._sheet.columns_auto_resize(0, len(SHEET_HEADERS) - 1)
+            # Write, bold and auto-size the header row in one request
+            spreadsheet.batch_update({"requests": _header_requests(self._sheet.id, SHEET_HEADERS)})
 
             # Add checkbox data validation for "Sent" column (Q)
             try:
@@ -147,8 +220,35 @@ class SheetsClient:
             except Exception:
                 pass  # Checkboxes are optional
 
+        self._spreadsheet = spreadsheet
         return self._sheet
 
+    def _open_spreadsheet(self, client):
+        """
+        Open the spreadsheet, by its remembered key when there is one.
+
+        Opening by name is a Google Drive search; opening by key is a direct
+        lookup. The key found by name is remembered for the next run; when it
+        differs from the remembered one, the cached post IDs belonged to
+        another spreadsheet and are dropped.
+
+        Raises:
+            gspread.SpreadsheetNotFound: If no spreadsheet has this name
+        """
+        key = self._id_cache.get_key(self.sheet_name) if self._id_cache else None
+        if key:
+            try:
+                return client.open_by_key(key)
+            except gspread.SpreadsheetNotFound:
+                logger.info(f"Remembered spreadsheet for {self.sheet_name} is gone, searching by name")
+
+        spreadsheet = client.open(self.sheet_name)
+        if self._id_cache and spreadsheet.id != key:
+            self._id_cache.clear(self.sheet_name)
+            self._id_cache.set_key(self.sheet_name, spreadsheet.id)
+            self._existing_ids = None
+        return spreadsheet
+
     def _get_or_create_action_sheet(self, spreadsheet):
         """Get or create the Action tab for comment-worthy leads."""
         try:
@@ -172,16 +272,53 @@ class SheetsClient:
 
         return action_sheet
 
-    def _lead_to_row(self, lead: Lead) -> list:
-        """Convert a Lead to a sheet row."""
+    @staticmethod
+    def _append_rows(sheet, rows: list[list]) -> int:
+        """
+        Append rows to a worksheet with Sheets API values.append requests.
+
+        Rows are sent APPEND_CHUNK_ROWS at a time to stay under the request
+        size cap. A rate-limited chunk (429/503) is retried with exponential
+        backoff.
+
+        Args:
+            sheet: Worksheet to append to
+            rows: Rows to append
+
+        Returns:
+            Number of rows appended (fewer than len(rows) if a chunk failed)
+        """
+        range_name = absolute_range_name(sheet.title, "A1")
+        params = {"valueInputOption": "USER_ENTERED", "insertDataOption": "INSERT_ROWS"}
+
+        appended = 0
+        for start in range(0, len(rows), APPEND_CHUNK_ROWS):
+            chunk = rows[start:start + APPEND_CHUNK_ROWS]
+            for attempt in range(APPEND_RETRIES + 1):
+                try:
+                    sheet.spreadsheet.values_append(range_name, params=params, body={"values": chunk})
+                    break
+                except gspread.exceptions.APIError as e:
+                    if e.code not in RATE_LIMIT_STATUSES or attempt == APPEND_RETRIES:
+                        logger.error(f"Error appending rows {start + 1}-{start + len(chunk)} to sheet: {e}")
+                        return appended
+                    delay = min(60, 2 ** attempt)
+                    logger.warning(f"Sheets API rate limited ({e.code}), retrying in {delay}s")
+                    time.sleep(delay)
+            appended += len(chunk)
+
+        return appended
+
+    def _lead_to_row(self, lead: Lead, timestamp: str) -> list:
+        """Convert a Lead to a sheet row (timestamp is shared by every row in a batch)."""
         return [
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp,
             lead.subreddit,
             lead.author,
-            lead.title[:100],  # Truncate for readability
+            lead.display_title,
             lead.post_url,
             lead.message_url,
-            ", ".join(lead.matched_triggers[:5]),  # Limit triggers
+            lead.triggers_csv,
             lead.language_detected or "",
             lead.signal_score or "",
             lead.signal_type or "",
@@ -208,30 +345,52 @@ class SheetsClient:
             "",     # Sent Date
         ]
 
-    def get_existing_post_ids(self) -> set[str]:
-        """Get set of post IDs already in the sheet."""
-        if not self.is_configured():
-            return set()
-
-        try:
-            sheet = self._get_or_create_sheet()
-            # Get all Post URLs (column E)
-            post_urls = sheet.col_values(5)  # 1-indexed
+    def _fetch_existing_post_ids(self) -> set[str]:
+        """Read the post IDs in the sheet (raises on API errors)."""
+        sheet = self._get_or_create_sheet()
+        # Get all Post URLs (column E, below the header) in one values.get call
+        response = sheet.spreadsheet.values_get(
+            absolute_range_name(sheet.title, POST_URL_RANGE),
+            params={"majorDimension": "COLUMNS"},
+        )
+        post_urls = response.get("values", [[]])[0]
 
-            post_ids = set()
-            for url in post_urls[1:]:  # Skip header
-                # Extract post ID from URL
-                # URL format: https://reddit.com/r/sub/comments/POST_ID/...
-                parts = url.split("/comments/")
-                if len(parts) > 1:
-                    post_id = parts[1].split("/")[0]
-                    post_ids.add(post_id)
+        # One regex pass over all URLs instead of splitting each one
+        return set(_POST_ID_RE.findall("\n".join(post_urls)))
 
-            return post_ids
+    def _ensure_existing_ids(self) -> set[str]:
+        """
+        Get the cached post IDs in the sheet.
 
-        except Exception as e:
-            logger.warning(f"Error getting existing posts from sheet: {e}")
-            return set()
+        The IDs come from the local post ID cache when this sheet was synced
+        within its TTL, otherwise from one read of column E. Appends made
+        through this client are added to both caches, so the sheet itself is
+        read about once per TTL. A failed read isn't cached.
+        """
+        if self._existing_ids is None:
+            try:
+                # Opening (or creating) the sheet first resets the caches for a new sheet
+                self._get_or_create_sheet()
+                if self._existing_ids is not None:
+                    return self._existing_ids
+
+                cached = self._id_cache.load(self.sheet_name) if self._id_cache else None
+                if cached is not None:
+                    self._existing_ids = cached
+                else:
+                    self._existing_ids = self._fetch_existing_post_ids()
+                    if self._id_cache:
+                        self._id_cache.replace(self.sheet_name, self._existing_ids)
+            except Exception as e:
+                logger.warning(f"Error getting existing posts from sheet: {e}")
+                return set()
+        return self._existing_ids
+
+    def _record_appended(self, existing_ids: set[str], post_ids: list[str]):
+        """Add just-appended post IDs to the in-memory and local caches."""
+        existing_ids.update(post_ids)
+        if self._id_cache and post_ids:
+            self._id_cache.add(self.sheet_name, post_ids)
 
     def append_lead(self, lead: Lead) -> bool:
         """
@@ -249,14 +408,16 @@ class SheetsClient:
 
         try:
             # Check for duplicates
-            existing_ids = self.get_existing_post_ids()
+            existing_ids = self._ensure_existing_ids()
             if lead.post_id in existing_ids:
                 logger.debug(f"Skipping duplicate in sheet: {lead.post_id}")
                 return False
 
             sheet = self._get_or_create_sheet()
-            row = self._lead_to_row(lead)
-            sheet.append_row(row, value_input_option="USER_ENTERED")
+            row = self._lead_to_row(lead, datetime.now().strftime(TIMESTAMP_FORMAT))
+            if not self._append_rows(sheet, [row]):
+                return False
+            self._record_appended(existing_ids, [lead.post_id])
 
             logger.info(f"Added lead to sheet: u/{lead.author} ({lead.post_id})")
             return True
@@ -287,13 +448,15 @@ class SheetsClient:
             return {"saved": 0, "skipped": 0, "filtered": 0}
 
         try:
-            # Get existing IDs once
-            existing_ids = self.get_existing_post_ids()
+            # Existing IDs (cached across calls on this client)
+            existing_ids = self._ensure_existing_ids()
 
             # Prepare rows to append
+            timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
             rows = []
-            action_rows = []
-            saved = 0
+            row_ids = []  # Post ID of each row, in order
+            batch_ids = set()
+            action_rows = {}
             skipped = 0
             filtered = 0
 
@@ -307,30 +470,32 @@ class SheetsClient:
                     filtered += 1
                     logger.debug(f"Filtering lead {lead.post_id}: score {lead.signal_score} < {min_score}")
                     continue
-                if lead.post_id in existing_ids:
+                if lead.post_id in existing_ids or lead.post_id in batch_ids:
                     skipped += 1
                     continue
 
-                rows.append(self._lead_to_row(lead))
-                existing_ids.add(lead.post_id)  # Track for this batch
-                saved += 1
+                rows.append(self._lead_to_row(lead, timestamp))
+                row_ids.append(lead.post_id)
+                batch_ids.add(lead.post_id)  # Track for this batch
 
                 # Add comment-worthy leads to Action tab
                 if lead.comment_worthy and lead.public_draft:
-                    action_rows.append(self._lead_to_action_row(lead))
+                    action_rows[lead.post_id] = self._lead_to_action_row(lead)
 
-            # Batch append to main sheet
+            # Batch append to main sheet (rows after a failed chunk count as skipped)
+            saved = 0
             if rows:
                 sheet = self._get_or_create_sheet()
-                sheet.append_rows(rows, value_input_option="USER_ENTERED")
+                saved = self._append_rows(sheet, rows)
+                skipped += len(rows) - saved
+                self._record_appended(existing_ids, row_ids[:saved])
 
-            # Batch append to Action tab
+            # Batch append to Action tab (only leads that made it into the main sheet)
+            action_rows = [action_rows[post_id] for post_id in row_ids[:saved] if post_id in action_rows]
             if action_rows:
                 try:
-                    client = self._get_client()
-                    spreadsheet = client.open(self.sheet_name)
-                    action_sheet = self._get_or_create_action_sheet(spreadsheet)
-                    action_sheet.append_rows(action_rows, value_input_option="USER_ENTERED")
+                    action_sheet = self._get_or_create_action_sheet(self._spreadsheet)
+                    self._append_rows(action_sheet, action_rows)
                     logger.info(f"Added {len(action_rows)} leads to Action tab")
                 except Exception as e:
                     logger.warning(f"Could not add to Action tab: {e}")
@@ -348,10 +513,14 @@ class SheetsClient:
             return None
 
         try:
-            client = self._get_client()
-            spreadsheet = client.open(self.sheet_name)
+            if self._spreadsheet is not None:
+                key = self._spreadsheet.id
+            else:
+                key = self._id_cache.get_key(self.sheet_name) if self._id_cache else None
+                if not key:
+                    key = self._open_spreadsheet(self._get_client()).id
             # Construct URL from spreadsheet ID (more reliable)
-            return f"https://docs.google.com/spreadsheets/d/{spreadsheet.id}"
+            return f"https://docs.google.com/spreadsheets/d/{key}"
         except Exception as e:
             logger.error(f"Error getting sheet URL: {e}")
             return None
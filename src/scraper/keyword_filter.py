@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from typing import Iterator, Optional
 
-from src.config.keywords import has_trigger_keyword, has_exclude_keyword
+from src.config.keywords import classify_text, has_exclude_keyword
 from src.config.languages import detect_language
 from src.storage.models import RedditPost, Lead
 
@@ -52,60 +52,50 @@ class KeywordFilter:
         Returns:
             FilterResult with pass/fail status and details
         """
+        return FilterResult(post, *self._classify(post))
+
+    def _classify(self, post: RedditPost) -> tuple[bool, list[str], list[str], Optional[str], str]:
+        """
+        Apply keyword filtering to a single post without building a FilterResult.
+
+        Returns:
+            Tuple of (passed, matched_triggers, matched_excludes, language_detected, reason)
+        """
         self.stats["total"] += 1
-        text = post.full_text
 
         # Skip deleted authors
         if post.author == "[deleted]":
             self.stats["deleted_author"] += 1
-            return FilterResult(
-                post=post,
-                passed=False,
-                matched_triggers=[],
-                matched_excludes=[],
-                language_detected=None,
-                reason="deleted_author",
-            )
-
-        # Check for exclusion keywords first (save processing)
-        has_exclude, excludes = has_exclude_keyword(text)
-        if self.exclude_on_match and has_exclude:
+            return False, [], [], None, "deleted_author"
+
+        # Exclusions usually show up in the title, so check it alone first:
+        # a post excluded there never has its body built, lowercased or scanned
+        excludes = has_exclude_keyword(post.title)[1] if self.exclude_on_match else []
+        if excludes:
+            triggers = []
+        else:
+            # Scan for exclusion and trigger keywords together on the post's
+            # lowercased text (shared with language detection); an excluded
+            # post reports no triggers
+            text = post.normalized_text
+            triggers, excludes = classify_text(text, stop_on_exclude=self.exclude_on_match, lowered=True)
+
+        # Check for exclusion keywords first
+        if self.exclude_on_match and excludes:
             self.stats["excluded"] += 1
-            return FilterResult(
-                post=post,
-                passed=False,
-                matched_triggers=[],
-                matched_excludes=excludes,
-                language_detected=None,
-                reason=f"excluded: {', '.join(excludes[:3])}",
-            )
+            return False, [], excludes, None, f"excluded: {', '.join(excludes[:3])}"
 
         # Check for trigger keywords
-        has_trigger, triggers = has_trigger_keyword(text)
-        if self.require_trigger and not has_trigger:
+        if self.require_trigger and not triggers:
             self.stats["no_trigger"] += 1
-            return FilterResult(
-                post=post,
-                passed=False,
-                matched_triggers=[],
-                matched_excludes=[],
-                language_detected=None,
-                reason="no_trigger",
-            )
+            return False, [], [], None, "no_trigger"
 
         # Detect language
-        language = detect_language(text)
+        language = detect_language(text, lowered=True)
 
         # Post passed all filters
         self.stats["passed"] += 1
-        return FilterResult(
-            post=post,
-            passed=True,
-            matched_triggers=triggers,
-            matched_excludes=excludes,
-            language_detected=language,
-            reason="passed",
-        )
+        return True, triggers, excludes, language, "passed"
 
     def filter_posts(self, posts: Iterator[RedditPost]) -> Iterator[Lead]:
         """
@@ -117,22 +107,22 @@ class KeywordFilter:
         Yields:
             Lead objects for posts that pass filtering
         """
+        # Checked once: most posts fail, and their debug lines are never shown
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         for post in posts:
-            result = self.filter_post(post)
-
-            if result.passed:
-                lead = Lead.from_post(
-                    post,
-                    matched_triggers=result.matched_triggers,
-                    language_detected=result.language_detected,
-                )
-                logger.debug(
-                    f"Lead found: u/{lead.author} in r/{lead.subreddit} "
-                    f"(triggers: {result.matched_triggers})"
-                )
+            passed, triggers, _, language, reason = self._classify(post)
+
+            if passed:
+                lead = Lead.from_post(post, matched_triggers=triggers, language_detected=language)
+                if debug:
+                    logger.debug(
+                        f"Lead found: u/{lead.author} in r/{lead.subreddit} "
+                        f"(triggers: {triggers})"
+                    )
                 yield lead
-            else:
-                logger.debug(f"Filtered out: {post.id} - {result.reason}")
+            elif debug:
+                logger.debug(f"Filtered out: {post.id} - {reason}")
 
     def get_stats(self) -> dict:
         """Get filtering statistics."""
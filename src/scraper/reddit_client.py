@@ -17,6 +17,8 @@ logger = logging.getLogger(__name__)
 class RedditClient:
     """Wrapper around PRAW for Reddit API access."""
 
+    is_mock = False  # Fetches real posts
+
     def __init__(self):
         """Initialize Reddit client with credentials from config."""
         if not reddit_config.is_valid():
@@ -36,17 +38,21 @@ class RedditClient:
 
     def _submission_to_post(self, submission: Submission) -> RedditPost:
         """Convert PRAW Submission to our RedditPost model."""
+        # Read the listing data PRAW already has; attribute access on a missing
+        # field would make PRAW fetch the whole submission again
+        data = vars(submission)
+        author = data.get("author")
         return RedditPost(
-            id=submission.id,
-            subreddit=str(submission.subreddit),
-            author=str(submission.author) if submission.author else "[deleted]",
-            title=submission.title,
-            selftext=submission.selftext or "",
-            url=submission.url,
-            permalink=submission.permalink,
-            created_utc=submission.created_utc,
-            score=submission.score,
-            num_comments=submission.num_comments,
+            id=data["id"],
+            subreddit=str(data.get("subreddit", "")),
+            author=str(author) if author else "[deleted]",
+            title=data.get("title", ""),
+            selftext=data.get("selftext") or "",
+            url=data.get("url", ""),
+            permalink=data.get("permalink", ""),
+            created_utc=data.get("created_utc", 0.0),
+            score=data.get("score", 0),
+            num_comments=data.get("num_comments", 0),
         )
 
     def get_new_posts(
@@ -148,9 +154,76 @@ class RedditClient:
         logger.info(f"Found {count} posts matching '{query}'")
 
 
+# Sample posts served by MockRedditClient (built once at import)
+_SAMPLE_POSTS: tuple[RedditPost, ...] = (
+    RedditPost(
+        id="test1",
+        subreddit="languagelearning",
+        author="anxious_learner",
+        title="Scared to speak Japanese with my in-laws visiting next month",
+        selftext="I've been learning Japanese for 2 years using Duolingo and textbooks, but I freeze up completely when trying to speak. My wife's parents are visiting from Tokyo next month and I'm terrified. Any advice?",
+        url="https://reddit.com/r/languagelearning/test1",
+        permalink="/r/languagelearning/comments/test1/scared_to_speak/",
+        created_utc=1702800000.0,
+        score=45,
+        num_comments=23,
+    ),
+    RedditPost(
+        id="test2",
+        subreddit="LearnJapanese",
+        author="jlpt_student",
+        title="Best resources for JLPT N3 grammar?",
+        selftext="Taking the test in July, need textbook recommendations.",
+        url="https://reddit.com/r/LearnJapanese/test2",
+        permalink="/r/LearnJapanese/comments/test2/jlpt_n3/",
+        created_utc=1702790000.0,
+        score=12,
+        num_comments=8,
+    ),
+    RedditPost(
+        id="test3",
+        subreddit="learnspanish",
+        author="moving_soon",
+        title="Moving to Barcelona in 3 months - frustrated I still can't speak",
+        selftext="I've been using apps for a year but I'm still afraid to speak with actual people. I can read pretty well but conversation terrifies me. Has anyone overcome this?",
+        url="https://reddit.com/r/learnspanish/test3",
+        permalink="/r/learnspanish/comments/test3/moving_barcelona/",
+        created_utc=1702780000.0,
+        score=67,
+        num_comments=31,
+    ),
+    RedditPost(
+        id="test4",
+        subreddit="Korean",
+        author="kdrama_fan",
+        title="Can someone translate this kdrama scene?",
+        selftext="I don't understand what they're saying at 32:15 in episode 5.",
+        url="https://reddit.com/r/Korean/test4",
+        permalink="/r/Korean/comments/test4/translate_kdrama/",
+        created_utc=1702770000.0,
+        score=5,
+        num_comments=3,
+    ),
+    RedditPost(
+        id="test5",
+        subreddit="French",
+        author="expat_france",
+        title="Been learning French for years but can't hold a conversation",
+        selftext="Frustrated because I understand everything when reading and can even watch movies without subtitles, but when someone speaks to me I blank out and can't respond. My partner's family thinks I'm rude because I barely speak at dinners. Anyone else experience this?",
+        url="https://reddit.com/r/French/test5",
+        permalink="/r/French/comments/test5/cant_speak/",
+        created_utc=1702760000.0,
+        score=89,
+        num_comments=45,
+    ),
+)
+
+
 class MockRedditClient:
     """Mock client for testing without API credentials."""
 
+    is_mock = True  # Serves _SAMPLE_POSTS
+
     def __init__(self):
         logger.info("Using MockRedditClient (no API credentials)")
 
@@ -161,71 +234,7 @@ class MockRedditClient:
         time_filter: str = "day",
     ) -> Iterator[RedditPost]:
         """Return sample posts for testing."""
-        sample_posts = [
-            RedditPost(
-                id="test1",
-                subreddit="languagelearning",
-                author="anxious_learner",
-                title="Scared to speak Japanese with my in-laws visiting next month",
-                selftext="I've been learning Japanese for 2 years using Duolingo and textbooks, but I freeze up completely when trying to speak. My wife's parents are visiting from Tokyo next month and I'm terrified. Any advice?",
-                url="https://reddit.com/r/languagelearning/test1",
-                permalink="/r/languagelearning/comments/test1/scared_to_speak/",
-                created_utc=1702800000.0,
-                score=45,
-                num_comments=23,
-            ),
-            RedditPost(
-                id="test2",
-                subreddit="LearnJapanese",
-                author="jlpt_student",
-                title="Best resources for JLPT N3 grammar?",
-                selftext="Taking the test in July, need textbook recommendations.",
-                url="https://reddit.com/r/LearnJapanese/test2",
-                permalink="/r/LearnJapanese/comments/test2/jlpt_n3/",
-                created_utc=1702790000.0,
-                score=12,
-                num_comments=8,
-            ),
-            RedditPost(
-                id="test3",
-                subreddit="learnspanish",
-                author="moving_soon",
-                title="Moving to Barcelona in 3 months - frustrated I still can't speak",
-                selftext="I've been using apps for a year but I'm still afraid to speak with actual people. I can read pretty well but conversation terrifies me. Has anyone overcome this?",
-                url="https://reddit.com/r/learnspanish/test3",
-                permalink="/r/learnspanish/comments/test3/moving_barcelona/",
-                created_utc=1702780000.0,
-                score=67,
-                num_comments=31,
-            ),
-            RedditPost(
-                id="test4",
-                subreddit="Korean",
-                author="kdrama_fan",
-                title="Can someone translate this kdrama scene?",
-                selftext="I don't understand what they're saying at 32:15 in episode 5.",
-                url="https://reddit.com/r/Korean/test4",
-                permalink="/r/Korean/comments/test4/translate_kdrama/",
-                created_utc=1702770000.0,
-                score=5,
-                num_comments=3,
-            ),
-            RedditPost(
-                id="test5",
-                subreddit="French",
-                author="expat_france",
-                title="Been learning French for years but can't hold a conversation",
-                selftext="Frustrated because I understand everything when reading and can even watch movies without subtitles, but when someone speaks to me I blank out and can't respond. My partner's family thinks I'm rude because I barely speak at dinners. Anyone else experience this?",
-                url="https://reddit.com/r/French/test5",
-                permalink="/r/French/comments/test5/cant_speak/",
-                created_utc=1702760000.0,
-                score=89,
-                num_comments=45,
-            ),
-        ]
-
-        for post in sample_posts[:limit]:
-            yield post
+        yield from _SAMPLE_POSTS[:limit]
 
     def get_hot_posts(self, subreddits: list[str], limit: int = 100) -> Iterator[RedditPost]:
         return self.get_new_posts(subreddits, limit)
@@ -3,7 +3,12 @@ CSV storage for leads.
 """
 
 import csv
+import io
+import json
 import logging
+import operator
+import re
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -11,14 +16,16 @@ from typing import Optional
 import pandas as pd
 
 from src.config.settings import app_config
-from src.storage.models import Lead
+from src.storage.models import CSV_FIELDS, Lead
+from src.storage.status_journal import STATUS_FILE_NAME, append_status, load_statuses
 
 logger = logging.getLogger(__name__)
 
 # CSV column order (Phase 1 + Phase 2 columns)
-CSV_COLUMNS = [
-    "scraped_at",
-    "created_at",
+CSV_COLUMNS = CSV_FIELDS
+
+# Columns in the daily action export, and getters for rows of leads.csv
+ACTION_COLS = (
     "subreddit",
     "author",
     "title",
@@ -26,21 +33,50 @@ CSV_COLUMNS = [
     "message_url",
     "matched_triggers",
     "language",
-    "score",
-    "comments",
-    "status",
-    # Phase 2: AI analysis columns
-    "signal_score",
-    "signal_type",
-    "category",
-    "comment_worthy",
-    "comment_worthy_reason",
-    "public_draft",
-    "dm_draft",
-    # Action tracking columns
-    "sent",
-    "sent_date",
-]
+)
+_ACTION_GET = operator.itemgetter(*(CSV_COLUMNS.index(column) for column in ACTION_COLS))
+_STATUS_IDX = CSV_COLUMNS.index("status")
+_POST_ID_IDX = CSV_COLUMNS.index("post_id")
+
+
+def _derive_action_status(row: dict) -> str:
+    """Compute action_status for rows written before the column existed."""
+    if row.get("sent", "").lower() in ("yes", "true", "1"):
+        return "sent"
+    if row.get("comment_worthy", "").lower() == "yes" and row.get("public_draft", "").strip():
+        return "pending"
+    return "skip"
+
+
+# Leads formatted and written per save_leads write
+SAVE_CHUNK_ROWS = 1024
+
+# Bytes before the end of a parsed file that must be unchanged for a larger
+# file to count as appended to (rather than rewritten)
+_APPEND_CHECK_BYTES = 256
+
+# Characters that force a field to be quoted (as csv.QUOTE_MINIMAL does)
+_NEEDS_QUOTES_RE = re.compile(r'[,"\r\n]')
+
+
+def _row_to_line(fields: tuple[str, ...]) -> str:
+    """
+    Format a Lead.to_csv_tuple() as one CSV line.
+
+    Produces the same bytes as csv.writer with the default dialect,
+    without its per-field type checks and dialect machinery.
+    """
+    return ",".join(
+        '"' + field.replace('"', '""') + '"' if _NEEDS_QUOTES_RE.search(field) else field
+        for field in fields
+    ) + "\r\n"
+
+
+def _post_id_from_url(post_url: str) -> str:
+    """Extract the post ID from a Reddit post URL ("" if it has none)."""
+    # URL format: https://reddit.com/r/sub/comments/POST_ID/...
+    _, found, rest = post_url.rpartition("/comments/")
+    return rest.partition("/")[0] if found else ""
 
 
 class CSVStorage:
@@ -56,6 +92,12 @@ class CSVStorage:
         self.data_dir = data_dir or app_config.data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.leads_file = self.data_dir / "leads.csv"
+        self.status_file = self.data_dir / STATUS_FILE_NAME  # Status changes, shared with action.py
+        self.ids_file = self.data_dir / "leads.ids"  # Post IDs in leads.csv, one per line
+        self.stats_file = self.data_dir / "leads_stats.json"  # get_stats() counts, kept up to date on save
+        # Last parse of leads.csv: (DataFrame, mtime_ns, size, header bytes, last bytes)
+        self._df_cache: Optional[tuple[pd.DataFrame, int, int, bytes, bytes]] = None
+        self._seen_post_ids: Optional[set[str]] = None  # Post IDs in the file (loaded once)
 
     def _ensure_file_exists(self):
         """Create CSV file with headers if it doesn't exist."""
@@ -64,26 +106,84 @@ class CSVStorage:
                 writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
                 writer.writeheader()
             logger.info(f"Created new leads file: {self.leads_file}")
+        else:
+            self._migrate_columns()
+
+    def _migrate_columns(self):
+        """Rewrite the CSV with the current columns if its header is outdated."""
+        with open(self.leads_file, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if tuple(reader.fieldnames or ()) == CSV_COLUMNS:
+                return
+            rows = list(reader)
+
+        for row in rows:
+            if not row.get("action_status"):
+                row["action_status"] = _derive_action_status(row)
+            if not row.get("post_id"):
+                row["post_id"] = _post_id_from_url(row.get("post_url") or "")
+
+        with open(self.leads_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, restval="", extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        logger.info(f"Migrated {len(rows)} leads to the current CSV columns")
+
+    def _read_ids_file(self) -> Optional[set[str]]:
+        """Read the post ID sidecar (None if missing or older than the CSV)."""
+        try:
+            if self.ids_file.stat().st_mtime_ns < self.leads_file.stat().st_mtime_ns:
+                # leads.csv was rewritten (migrated or edited) since the last append
+                return None
+            return set(self.ids_file.read_text(encoding="utf-8").split())
+        except OSError:
+            return None
+
+    def _read_csv_ids(self) -> set[str]:
+        """Read the post IDs from the CSV itself (only its post_id column)."""
+        with open(self.leads_file, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if "post_id" in header:
+                column = header.index("post_id")
+                return {row[column] for row in reader if len(row) > column}
+            # Written before the post_id column existed
+            column = header.index("post_url")
+            return {_post_id_from_url(row[column]) for row in reader if len(row) > column}
+
+    def _load_seen_ids(self) -> set[str]:
+        """
+        Get the cached post IDs in the file.
+
+        The IDs are read once, from the leads.ids sidecar (one ID per line)
+        when it is current, otherwise from the CSV's post_id column, which
+        rebuilds the sidecar. Saves through this instance add to the set and
+        the sidecar. A failed read isn't cached.
+        """
+        if self._seen_post_ids is None:
+            if not self.leads_file.exists():
+                self._seen_post_ids = set()
+                return self._seen_post_ids
+
+            post_ids = self._read_ids_file()
+            if post_ids is None:
+                try:
+                    post_ids = self._read_csv_ids()
+                except (OSError, csv.Error, ValueError) as e:
+                    logger.warning(f"Error reading existing posts: {e}")
+                    return set()
+                post_ids.discard("")
+                try:
+                    self.ids_file.write_text("".join(f"{post_id}\n" for post_id in post_ids), encoding="utf-8")
+                except OSError as e:
+                    logger.warning(f"Could not write {self.ids_file}: {e}")
+            self._seen_post_ids = post_ids
+
+        return self._seen_post_ids
 
     def get_existing_post_ids(self) -> set[str]:
         """Get set of post IDs already in storage (for deduplication)."""
-        if not self.leads_file.exists():
-            return set()
-
-        try:
-            df = pd.read_csv(self.leads_file)
-            # Extract post IDs from URLs
-            post_ids = set()
-            for url in df["post_url"]:
-                # URL format: https://reddit.com/r/sub/comments/POST_ID/...
-                parts = url.split("/comments/")
-                if len(parts) > 1:
-                    post_id = parts[1].split("/")[0]
-                    post_ids.add(post_id)
-            return post_ids
-        except Exception as e:
-            logger.warning(f"Error reading existing posts: {e}")
-            return set()
+        return set(self._load_seen_ids())
 
     def save_lead(self, lead: Lead) -> bool:
         """
@@ -98,15 +198,20 @@ class CSVStorage:
         self._ensure_file_exists()
 
         # Check for duplicate
-        existing_ids = self.get_existing_post_ids()
+        existing_ids = self._load_seen_ids()
         if lead.post_id in existing_ids:
             logger.debug(f"Skipping duplicate: {lead.post_id}")
             return False
 
-        # Append to CSV
-        with open(self.leads_file, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-            writer.writerow(lead.to_csv_row())
+        stats = self._load_stats()
+
+        # Append to CSV (the sidecar is closed last, so it stays newer than the CSV)
+        with open(self.ids_file, "a", encoding="utf-8") as ids_f, \
+                open(self.leads_file, "a", newline="", encoding="utf-8") as f:
+            f.write(_row_to_line(lead.to_csv_tuple()))
+            ids_f.write(lead.post_id + "\n")
+        existing_ids.add(lead.post_id)
+        self._count_saved(stats, [lead])
 
         logger.info(f"Saved lead: u/{lead.author} ({lead.post_id})")
         return True
@@ -123,34 +228,104 @@ class CSVStorage:
             Stats dict with saved/skipped/filtered counts
         """
         self._ensure_file_exists()
-        existing_ids = self.get_existing_post_ids()
+        existing_ids = self._load_seen_ids()
 
-        saved = 0
         skipped = 0
         filtered = 0
-
-        with open(self.leads_file, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-
-            for lead in leads:
-                if lead.post_id in existing_ids:
-                    skipped += 1
+        new_leads = []
+        batch_ids = set()  # Track for this batch
+
+        for lead in leads:
+            if lead.post_id in existing_ids or lead.post_id in batch_ids:
+                skipped += 1
+                continue
+
+            # Filter by minimum score if specified
+            if min_score is not None:
+                if not lead.signal_score or lead.signal_score < min_score:
+                    filtered += 1
+                    logger.debug(f"Filtering lead {lead.post_id}: score {lead.signal_score} < {min_score}")
                     continue
 
-                # Filter by minimum score if specified
-                if min_score is not None:
-                    if not lead.signal_score or lead.signal_score < min_score:
-                        filtered += 1
-                        logger.debug(f"Filtering lead {lead.post_id}: score {lead.signal_score} < {min_score}")
-                        continue
-
-                writer.writerow(lead.to_csv_row())
-                existing_ids.add(lead.post_id)  # Track for this batch
-                saved += 1
+            new_leads.append(lead)
+            batch_ids.add(lead.post_id)
+
+        # One write per file per chunk, so formatted rows never pile up for the
+        # whole batch (the sidecar is closed last, so it stays newer than the CSV)
+        stats = self._load_stats() if new_leads else None
+        for start in range(0, len(new_leads), SAVE_CHUNK_ROWS):
+            chunk = new_leads[start:start + SAVE_CHUNK_ROWS]
+            with open(self.ids_file, "a", encoding="utf-8") as ids_f, \
+                    open(self.leads_file, "a", newline="", encoding="utf-8") as f:
+                f.write("".join([_row_to_line(lead.to_csv_tuple()) for lead in chunk]))
+                ids_f.write("".join([lead.post_id + "\n" for lead in chunk]))
+            existing_ids.update(lead.post_id for lead in chunk)
+            self._count_saved(stats, chunk)
+        saved = len(new_leads)
 
         logger.info(f"Saved {saved} leads, skipped {skipped} duplicates, filtered {filtered} (score < {min_score})")
         return {"saved": saved, "skipped": skipped, "filtered": filtered}
 
+    def _read_df(self) -> pd.DataFrame:
+        """
+        Parse leads.csv, reusing the last parse while the file is unchanged.
+
+        Values are read as strings (empty cells as NaN). When the file has
+        only grown by appends since the last parse, just the new rows are
+        parsed and added. The returned DataFrame is shared; don't modify it.
+        """
+        stat = self.leads_file.stat()
+        cached = self._df_cache
+        if cached and (stat.st_mtime_ns, stat.st_size) == cached[1:3]:
+            return cached[0]
+
+        with open(self.leads_file, "rb") as f:
+            header = f.readline()
+            df = None
+            if cached and stat.st_size > cached[2] and header == cached[3]:
+                # Appended to if the bytes up to the old end are the same
+                start = cached[2] - len(cached[4])
+                f.seek(start)
+                tail = f.read(len(cached[4]))
+                if tail == cached[4]:
+                    new_rows = pd.read_csv(io.BytesIO(f.read()), names=cached[0].columns, header=None, dtype=str)
+                    df = pd.concat([cached[0], new_rows], ignore_index=True)
+            if df is None:
+                f.seek(0)
+                df = pd.read_csv(f, dtype=str, engine="c")
+
+            f.seek(max(len(header), stat.st_size - _APPEND_CHECK_BYTES))
+            tail = f.read()
+
+        self._df_cache = (df, stat.st_mtime_ns, stat.st_size, header, tail)
+        return df
+
+    def _read_leads(self, columns: Optional[list[str]] = None) -> pd.DataFrame:
+        """
+        Read the leads file with logged status changes applied.
+
+        Args:
+            columns: Columns to return (default: all). Must include post_id and status.
+        """
+        # Migrating first guarantees the post_id column
+        self._ensure_file_exists()
+        df = self._read_df()
+        df = df[columns] if columns else df.copy()
+
+        latest = self._logged_statuses()
+        if latest:
+            df["status"] = df["post_id"].map(latest).fillna(df["status"])
+
+        return df
+
+    def _logged_statuses(self) -> dict[str, str]:
+        """Load the status journal as {post_id: latest status} (sent-only entries have none)."""
+        return {
+            post_id: row["status"]
+            for post_id, row in load_statuses(self.status_file).items()
+            if row["status"]
+        }
+
     def get_leads(
         self,
         status: Optional[str] = None,
@@ -166,12 +341,12 @@ class CSVStorage:
             limit: Max rows to return
 
         Returns:
-            DataFrame of leads
+            DataFrame of leads (values as strings)
         """
         if not self.leads_file.exists():
-            return pd.DataFrame(columns=CSV_COLUMNS)
+            return pd.DataFrame(columns=list(CSV_COLUMNS))
 
-        df = pd.read_csv(self.leads_file)
+        df = self._read_leads()
 
         if status:
             df = df[df["status"] == status]
@@ -187,14 +362,67 @@ class CSVStorage:
         if not self.leads_file.exists():
             return {"total": 0, "by_status": {}, "by_language": {}}
 
-        df = pd.read_csv(self.leads_file)
+        self._ensure_file_exists()
+        stats = self._load_stats()
+        if stats is None:
+            # Only the counted columns (and post_id, for logged statuses) are copied
+            df = self._read_leads(["post_id", "status", "language", "subreddit"])
+            stats = {
+                "total": len(df),
+                "by_status": df["status"].value_counts().to_dict(),
+                "by_language": df["language"].value_counts().to_dict(),
+                "by_subreddit": df["subreddit"].value_counts().to_dict(),
+            }
+            self._save_stats(stats)
+
+        return stats
+
+    def _file_signature(self) -> list[int]:
+        """mtime and size of leads.csv and the status journal (saved stats are valid while these match)."""
+        signature = []
+        for path in (self.leads_file, self.status_file):
+            try:
+                stat = path.stat()
+                signature += [stat.st_mtime_ns, stat.st_size]
+            except FileNotFoundError:
+                signature += [0, 0]
+        return signature
+
+    def _load_stats(self) -> Optional[dict]:
+        """Load the saved stats (None if missing or the files changed since)."""
+        try:
+            with open(self.stats_file, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
 
-        return {
-            "total": len(df),
-            "by_status": df["status"].value_counts().to_dict(),
-            "by_language": df["language"].value_counts().to_dict(),
-            "by_subreddit": df["subreddit"].value_counts().to_dict(),
-        }
+        if saved.get("signature") != self._file_signature():
+            return None
+        return saved.get("stats")
+
+    def _save_stats(self, stats: dict):
+        """Save stats along with the current file signature."""
+        try:
+            with open(self.stats_file, "w", encoding="utf-8") as f:
+                json.dump({"signature": self._file_signature(), "stats": stats}, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Could not write {self.stats_file}: {e}")
+
+    def _count_saved(self, stats: Optional[dict], leads: list[Lead]):
+        """Add just-appended leads to the stats that were valid before the append."""
+        if stats is None or not leads:
+            return
+
+        stats["total"] += len(leads)
+        for key, values in (
+            ("by_status", [lead.status for lead in leads]),
+            ("by_language", [lead.language_detected for lead in leads if lead.language_detected]),
+            ("by_subreddit", [lead.subreddit for lead in leads]),
+        ):
+            counts = Counter(stats.get(key, {}))
+            counts.update(values)
+            stats[key] = dict(counts.most_common())
+        self._save_stats(stats)
 
     def update_status(self, post_id: str, new_status: str) -> bool:
         """
@@ -207,18 +435,11 @@ class CSVStorage:
         Returns:
             True if updated, False if not found
         """
-        if not self.leads_file.exists():
-            return False
-
-        df = pd.read_csv(self.leads_file)
-
-        # Find by post_id in URL
-        mask = df["post_url"].str.contains(f"/comments/{post_id}/")
-        if not mask.any():
+        if post_id not in self._load_seen_ids():
             return False
 
-        df.loc[mask, "status"] = new_status
-        df.to_csv(self.leads_file, index=False)
+        # Journal the change instead of rewriting leads.csv
+        append_status(self.status_file, post_id, new_status)
         return True
 
     def export_for_action(self, output_file: Optional[Path] = None) -> Path:
@@ -235,21 +456,23 @@ class CSVStorage:
             date_str = datetime.now().strftime("%Y%m%d")
             output_file = self.data_dir / f"leads_action_{date_str}.csv"
 
-        df = self.get_leads(status="new")
-
-        # Select action-relevant columns
-        action_cols = [
-            "subreddit",
-            "author",
-            "title",
-            "post_url",
-            "message_url",
-            "matched_triggers",
-            "language",
-        ]
-        df[action_cols].to_csv(output_file, index=False)
-
-        logger.info(f"Exported {len(df)} leads to {output_file}")
+        latest = self._logged_statuses()
+
+        # Stream rows from leads.csv into the export (migrating first fixes the column order)
+        exported = 0
+        self._ensure_file_exists()
+        with open(self.leads_file, "r", newline="", encoding="utf-8", buffering=1 << 20) as src, \
+                open(output_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst, lineterminator="\n")
+            next(reader, None)
+            writer.writerow(ACTION_COLS)
+            for row in reader:
+                if latest.get(row[_POST_ID_IDX], row[_STATUS_IDX]) == "new":
+                    writer.writerow(_ACTION_GET(row))
+                    exported += 1
+
+        logger.info(f"Exported {exported} leads to {output_file}")
         return output_file
 
 
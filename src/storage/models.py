@@ -3,11 +3,48 @@ Data models for Reddit leads.
 """
 
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+# Title length and trigger count shown in sheets, CSVs and prompts
+DISPLAY_TITLE_CHARS = 100
+DISPLAY_TRIGGERS = 5
 
-@dataclass
+# CSV column order, matching Lead.to_csv_tuple (Phase 1 + Phase 2 columns)
+CSV_FIELDS = (
+    "scraped_at",
+    "created_at",
+    "subreddit",
+    "author",
+    "title",
+    "post_url",
+    "message_url",
+    "matched_triggers",
+    "language",
+    "score",
+    "comments",
+    "status",
+    # Phase 2: AI analysis columns
+    "signal_score",
+    "signal_type",
+    "category",
+    "comment_worthy",
+    "comment_worthy_reason",
+    "kaiwa_mention",
+    "public_draft",
+    "dm_draft",
+    # Action tracking columns
+    "sent",
+    "sent_date",
+    "action_status",  # pending / sent / skip, precomputed for action.py
+    "post_id",  # Stored so deduplication doesn't parse post_url
+)
+
+# CSV spelling of optional yes/no fields
+_BOOL_STR = {None: "", True: "yes", False: "no"}
+
+
+@dataclass(slots=True)
 class RedditPost:
     """Raw Reddit post/submission data."""
     id: str
@@ -20,12 +57,20 @@ class RedditPost:
     created_utc: float
     score: int
     num_comments: int
+    _normalized_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def full_text(self) -> str:
         """Combined title and body text."""
         return f"{self.title} {self.selftext}"
 
+    @property
+    def normalized_text(self) -> str:
+        """Lowercased full_text (computed once, shared by keyword and language matching)."""
+        if self._normalized_text is None:
+            self._normalized_text = self.full_text.lower()
+        return self._normalized_text
+
     @property
     def direct_url(self) -> str:
         """Full Reddit URL."""
@@ -38,11 +83,11 @@ class RedditPost:
 
     @property
     def created_datetime(self) -> datetime:
-        """Convert UTC timestamp to datetime."""
-        return datetime.utcfromtimestamp(self.created_utc)
+        """Convert UTC timestamp to a naive UTC datetime."""
+        return datetime.fromtimestamp(self.created_utc, timezone.utc).replace(tzinfo=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class Lead:
     """A filtered, qualified lead from Reddit."""
     # Post info
@@ -81,6 +126,10 @@ class Lead:
     sent: bool = False  # Whether comment has been posted
     sent_date: Optional[str] = None  # When comment was posted
 
+    # Cached display values (see display_title / triggers_csv)
+    _display_title: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _triggers_csv: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @classmethod
     def from_post(
         cls,
@@ -107,6 +156,7 @@ class Lead:
     def to_dict(self) -> dict:
         """Convert to dictionary for CSV/JSON export."""
         data = asdict(self)
+        del data["_display_title"], data["_triggers_csv"]
         # Convert datetime objects to ISO strings
         data["created_at"] = self.created_at.isoformat()
         data["scraped_at"] = self.scraped_at.isoformat()
@@ -114,34 +164,63 @@ class Lead:
         data["matched_triggers"] = ", ".join(self.matched_triggers)
         return data
 
-    def to_csv_row(self) -> dict:
-        """Convert to a flat dict suitable for CSV."""
-        return {
-            "scraped_at": self.scraped_at.strftime("%Y-%m-%d %H:%M:%S"),
-            "created_at": self.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            "subreddit": self.subreddit,
-            "author": self.author,
-            "title": self.title[:100],  # Truncate for readability
-            "post_url": self.post_url,
-            "message_url": self.message_url,
-            "matched_triggers": ", ".join(self.matched_triggers),
-            "language": self.language_detected or "",
-            "score": self.score,
-            "comments": self.num_comments,
-            "status": self.status,
+    @property
+    def display_title(self) -> str:
+        """Title truncated for readability (computed once)."""
+        if self._display_title is None:
+            self._display_title = self.title[:DISPLAY_TITLE_CHARS]
+        return self._display_title
+
+    @property
+    def triggers_csv(self) -> str:
+        """First few matched triggers, comma-separated (computed once)."""
+        if self._triggers_csv is None:
+            self._triggers_csv = ", ".join(self.matched_triggers[:DISPLAY_TRIGGERS])
+        return self._triggers_csv
+
+    @property
+    def action_status(self) -> str:
+        """Action queue status: pending (ready to post), sent, or skip."""
+        if self.sent:
+            return "sent"
+        if self.comment_worthy and self.public_draft:
+            return "pending"
+        return "skip"
+
+    def to_csv_tuple(self) -> tuple[str, ...]:
+        """Convert to CSV field strings in CSV_FIELDS order."""
+        return (
+            # "YYYY-MM-DD HH:MM:SS" (isoformat skips strftime's format parsing)
+            self.scraped_at.isoformat(" ", "seconds"),
+            self.created_at.isoformat(" ", "seconds"),
+            self.subreddit,
+            self.author,
+            self.display_title,
+            self.post_url,
+            self.message_url,
+            ", ".join(self.matched_triggers),
+            self.language_detected or "",
+            str(self.score),
+            str(self.num_comments),
+            self.status,
             # Phase 2: AI analysis fields
-            "signal_score": self.signal_score or "",
-            "signal_type": self.signal_type or "",
-            "category": self.category or "",
-            "comment_worthy": "" if self.comment_worthy is None else ("yes" if self.comment_worthy else "no"),
-            "comment_worthy_reason": self.comment_worthy_reason or "",
-            "kaiwa_mention": "" if self.kaiwa_mention_allowed is None else ("yes" if self.kaiwa_mention_allowed else "no"),
-            "public_draft": self.public_draft or "",
-            "dm_draft": self.dm_draft or "",
-            "sent": "yes" if self.sent else "",
-            "sent_date": self.sent_date or "",
-        }
+            str(self.signal_score) if self.signal_score else "",
+            self.signal_type or "",
+            self.category or "",
+            _BOOL_STR[self.comment_worthy],
+            self.comment_worthy_reason or "",
+            _BOOL_STR[self.kaiwa_mention_allowed],
+            self.public_draft or "",
+            self.dm_draft or "",
+            "yes" if self.sent else "",
+            self.sent_date or "",
+            self.action_status,
+            self.post_id,
+        )
 
+    def to_csv_row(self) -> dict:
+        """Convert to a flat dict suitable for CSV."""
+        return dict(zip(CSV_FIELDS, self.to_csv_tuple()))
 
 if __name__ == "__main__":
     # Test with sample data
@@ -0,0 +1,90 @@
+"""
+Append-only journal of lead status changes.
+
+Changing one lead's status would otherwise mean rewriting the whole of
+leads.csv, so changes are appended here instead and overlaid on the leads
+when they are read. CSVStorage and action.py share this one file, so a lead
+marked as sent in either is seen by both.
+
+Each row records either a lifecycle status (Lead.status: new, contacted, ...)
+or that the comment was sent, never both. The latest status wins, while sent
+stays set once recorded, so a later status change can't put a sent lead back
+in the action queue.
+
+Kept free of pandas and config imports so action.py stays quick to start.
+"""
+
+import csv
+from datetime import datetime
+from pathlib import Path
+
+# Journal file name, in the data directory next to leads.csv
+STATUS_FILE_NAME = "leads_status.csv"
+STATUS_COLUMNS = ["post_id", "status", "sent_date", "updated_at"]
+
+
+def load_statuses(path: Path) -> dict[str, dict[str, str]]:
+    """
+    Load the journal as {post_id: {"status": ..., "sent_date": ...}}.
+
+    Args:
+        path: Journal file
+
+    Returns:
+        Per post ID, the latest status ("" if only sent was recorded) and the
+        date it was sent ("" if it wasn't). Empty if there is no journal.
+    """
+    if not path.exists():
+        return {}
+
+    entries = {}
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            entry = entries.setdefault(row["post_id"], {"status": "", "sent_date": ""})
+            # Later statuses win; the first sent date is kept
+            if row["status"]:
+                entry["status"] = row["status"]
+            if row["sent_date"] and not entry["sent_date"]:
+                entry["sent_date"] = row["sent_date"]
+    return entries
+
+
+def _append(path: Path, post_id: str, status: str = "", sent_date: str = ""):
+    """Append one row to the journal (created with a header if missing)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_header = not path.exists()
+
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=STATUS_COLUMNS)
+        if write_header:
+            writer.writeheader()
+        writer.writerow({
+            "post_id": post_id,
+            "status": status,
+            "sent_date": sent_date,
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        })
+
+
+def append_status(path: Path, post_id: str, status: str):
+    """
+    Record a lifecycle status change in the journal.
+
+    Args:
+        path: Journal file
+        post_id: Reddit post ID
+        status: New Lead.status value (new, contacted, replied, ...)
+    """
+    _append(path, post_id, status=status)
+
+
+def append_sent(path: Path, post_id: str, sent_date: str):
+    """
+    Record that a lead's comment was sent.
+
+    Args:
+        path: Journal file
+        post_id: Reddit post ID
+        sent_date: When the comment was posted
+    """
+    _append(path, post_id, sent_date=sent_date)
@@ -91,7 +91,7 @@ def test_reddit():
         client = get_reddit_client(use_mock=False)
         print(f"Client type: {type(client).__name__}")
 
-        if type(client).__name__ == "MockRedditClient":
+        if client.is_mock:
             print("SKIP: Using mock client (credentials not configured)")
             return False
 